@@ -74,6 +74,10 @@ async def update_settings(
     await db.commit()
     await db.refresh(settings)
 
+    # Workflow executions cache the client built from these settings
+    from app.services.executor import invalidate_client_cache
+    invalidate_client_cache()
+
     return {
         "status": "success",
         "message": "Settings updated successfully"
@@ -130,6 +130,11 @@ async def update_workflow(
 
     await db.commit()
     await db.refresh(workflow)
+
+    # Executions cache the traversal maps built from nodes/edges
+    from app.services.executor import invalidate_graph_cache
+    invalidate_graph_cache(workflow_id)
+
     return workflow
 
 
@@ -158,6 +163,9 @@ async def delete_workflow(
     await db.delete(workflow)
     await db.commit()
 
+    from app.services.executor import invalidate_graph_cache
+    invalidate_graph_cache(workflow_id)
+
     return {"status": "success", "message": "Workflow deleted"}
 
 
@@ -1,9 +1,10 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from typing import List, Dict, Set, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 import asyncio
 import json
 import logging
+import time
 import websockets
 
 logger = logging.getLogger(__name__)
@@ -17,9 +18,12 @@ class ConnectionManager:
         self.subscriptions: Dict[str, Set[WebSocket]] = {}  # symbol -> connections
         self.openalgo_ws: websockets.WebSocketClientProtocol | None = None
         self.openalgo_task: asyncio.Task | None = None
+        # Loop serving client sockets; broadcasts are always sent from it
+        self.loop: asyncio.AbstractEventLoop | None = None
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
+        self.loop = asyncio.get_running_loop()
         self.active_connections.append(websocket)
         logger.info(f"Client connected. Total: {len(self.active_connections)}")
 
@@ -33,6 +37,10 @@ class ConnectionManager:
                 del self.subscriptions[symbol]
         logger.info(f"Client disconnected. Total: {len(self.active_connections)}")
 
+    def has_connections(self) -> bool:
+        """Whether any client is connected to receive broadcasts"""
+        return bool(self.active_connections)
+
     async def broadcast(self, message: dict):
         """Broadcast to all connections"""
         for connection in self.active_connections:
@@ -111,8 +119,54 @@ async def websocket_endpoint(websocket: WebSocket):
         manager.disconnect(websocket)
 
 
-async def broadcast_execution_update(workflow_id: int, status: str, message: str, logs: Optional[list] = None):
-    """Broadcast workflow execution updates
+# Execution updates are queued and sent by one background task on the loop
+# serving client sockets, so workflow runs (on any loop or thread) never wait
+# on them. Updates queued within BROADCAST_INTERVAL seconds go out together as
+# one "execution_batch" frame.
+BROADCAST_INTERVAL = 0.02
+BROADCAST_MAX_BATCH = 100
+_broadcast_queue: Optional[asyncio.Queue] = None
+_broadcast_task: Optional[asyncio.Task] = None
+
+
+async def _drain_broadcasts(queue: asyncio.Queue):
+    """Send queued execution updates, batching those that arrive close together"""
+    while True:
+        batch = [await queue.get()]
+        await asyncio.sleep(BROADCAST_INTERVAL)
+        while len(batch) < BROADCAST_MAX_BATCH and not queue.empty():
+            batch.append(queue.get_nowait())
+        for data in batch:
+            # Naive UTC ISO string, as clients have always received
+            data["timestamp"] = (
+                datetime.fromtimestamp(data["timestamp"], timezone.utc).replace(tzinfo=None).isoformat()
+            )
+        try:
+            if len(batch) == 1:
+                await manager.broadcast(batch[0])
+            else:
+                await manager.broadcast({"type": "execution_batch", "updates": batch})
+        except Exception as e:
+            logger.error(f"Failed to broadcast execution updates: {e}")
+
+
+def _enqueue_broadcast(data: dict):
+    """Add an update to the broadcast queue (runs on the socket loop)"""
+    global _broadcast_queue, _broadcast_task
+    if _broadcast_queue is None:
+        _broadcast_queue = asyncio.Queue()
+    if _broadcast_task is None or _broadcast_task.done():
+        _broadcast_task = asyncio.get_running_loop().create_task(
+            _drain_broadcasts(_broadcast_queue)
+        )
+    _broadcast_queue.put_nowait(data)
+
+
+def queue_execution_update(workflow_id: int, status: str, message: str, logs: Optional[list] = None):
+    """Queue a workflow execution update for broadcast without waiting
+
+    Safe to call from any thread or event loop: the update is handed to the
+    loop serving client sockets. Dropped when no client is connected.
 
     Args:
         workflow_id: The workflow being executed
@@ -120,14 +174,33 @@ async def broadcast_execution_update(workflow_id: int, status: str, message: str
         message: Status message
         logs: Optional list of log entries
     """
+    if not manager.has_connections():
+        return
+
     data = {
         "type": "execution",
         "workflow_id": workflow_id,
         "status": status,
         "message": message,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": time.time(),  # Formatted by the sender, off the run's path
     }
     if logs is not None:
         data["logs"] = logs
 
-    await manager.broadcast(data)
+    loop = manager.loop
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        _enqueue_broadcast(data)
+        return
+    try:
+        loop.call_soon_threadsafe(_enqueue_broadcast, data)
+    except RuntimeError:
+        pass  # Socket loop closed (shutting down)
+
+
+async def broadcast_execution_update(workflow_id: int, status: str, message: str, logs: Optional[list] = None):
+    """Broadcast workflow execution updates (see queue_execution_update)"""
+    queue_execution_update(workflow_id, status, message, logs)
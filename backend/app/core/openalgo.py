@@ -3,15 +3,39 @@ OpenAlgo SDK Wrapper
 Uses official openalgo Python library v1.0.45+
 """
 from openalgo import api
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Tuple
+from functools import lru_cache, partial
 import logging
+import queue
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Stream mode -> SDK subscribe method
+_WS_SUBSCRIBE = {
+    "ltp": "subscribe_ltp",
+    "quote": "subscribe_quote",
+    "depth": "subscribe_depth",
+}
+
+
+@lru_cache(maxsize=4096)
+def ws_instrument(exchange: str, symbol: str) -> dict:
+    """Shared {"exchange", "symbol"} dict for an instrument (do not mutate)"""
+    return {"exchange": exchange, "symbol": symbol}
+
 
 class OpenAlgoClient:
     """Wrapper around the official OpenAlgo Python SDK"""
 
+    # Batched subscribes: requests queued within this window (seconds) are
+    # sent together, up to WS_MAX_BATCH_SIZE instruments per batch
+    WS_BATCH_INTERVAL = 0.02
+    WS_MAX_BATCH_SIZE = 50
+    WS_BATCH_IDLE_TIMEOUT = 60.0  # Batch thread exits after this long idle
+    WS_TICK_MAX_AGE = 1.0  # Seconds a cached tick may be handed to a new listener
+
     def __init__(
         self,
         api_key: str,
@@ -23,6 +47,23 @@ class OpenAlgoClient:
         self.ws_url = ws_url
         self.client = api(api_key=api_key, host=host, ws_url=ws_url)
         self._ws_connected = False
+        # The SDK keeps a single callback per stream mode, so ours routes each
+        # tick to the listeners registered for its (exchange, symbol)
+        self._ws_lock = threading.Lock()
+        self._ws_listeners: Dict[str, Dict[Tuple[str, str], List[Callable]]] = {
+            mode: {} for mode in _WS_SUBSCRIBE
+        }
+        self._ws_handlers = {mode: partial(self._ws_dispatch, mode) for mode in _WS_SUBSCRIBE}
+        # Instruments subscribed on the current connection, and their latest
+        # tick with its monotonic receive time
+        self._ws_subscribed: Dict[str, set] = {mode: set() for mode in _WS_SUBSCRIBE}
+        # Instruments whose subscribe is queued or in flight
+        self._ws_pending: Dict[str, set] = {mode: set() for mode in _WS_SUBSCRIBE}
+        self._ws_last_tick: Dict[str, Dict[Tuple[str, str], Tuple[float, dict]]] = {
+            mode: {} for mode in _WS_SUBSCRIBE
+        }
+        self._ws_queue: "queue.Queue[Tuple[str, dict]]" = queue.Queue()
+        self._ws_batch_thread: Optional[threading.Thread] = None
 
     def place_order(
         self,
@@ -422,6 +463,7 @@ class OpenAlgoClient:
         """Connect to WebSocket server"""
         try:
             self.client.connect()
+            self._ws_reset_subscriptions()
             self._ws_connected = True
             logger.info("WebSocket connected")
             return True
@@ -434,6 +476,7 @@ class OpenAlgoClient:
         """Disconnect from WebSocket server"""
         try:
             self.client.disconnect()
+            self._ws_reset_subscriptions()
             self._ws_connected = False
             logger.info("WebSocket disconnected")
         except Exception as e:
@@ -443,6 +486,188 @@ class OpenAlgoClient:
         """Check if WebSocket is connected"""
         return self._ws_connected
 
+    def _ws_reset_subscriptions(self):
+        """Forget server-side subscriptions (a new connection starts with none)"""
+        with self._ws_lock:
+            for mode in _WS_SUBSCRIBE:
+                self._ws_subscribed[mode].clear()
+                self._ws_last_tick[mode].clear()
+
+    def _ws_dispatch(self, mode: str, data: dict):
+        """SDK callback for a stream mode: pass the tick to its instrument's listeners"""
+        key = (data.get("exchange"), data.get("symbol"))
+        self._ws_last_tick[mode][key] = (time.monotonic(), data)
+        listeners = self._ws_listeners[mode].get(key)
+        if listeners:
+            for callback in list(listeners):
+                callback(data)
+
+    def _ws_add_listener(self, mode: str, instruments: list, callback: Callable) -> list:
+        """Register callback for ticks of the given instruments
+
+        Returns the instruments that still need a subscribe on this connection
+        (and marks them pending until _ws_send_subscribe settles them).
+        Instruments already streaming or pending are not sent to the server
+        again; for streaming ones callback gets the latest tick right away if
+        it is under WS_TICK_MAX_AGE old, else it waits for the next tick.
+        """
+        new_instruments = []
+        cached_ticks = []
+        with self._ws_lock:
+            listeners = self._ws_listeners[mode]
+            subscribed = self._ws_subscribed[mode]
+            pending = self._ws_pending[mode]
+            for instrument in instruments:
+                key = (instrument.get("exchange"), instrument.get("symbol"))
+                callbacks = listeners.setdefault(key, [])
+                if callback not in callbacks:
+                    callbacks.append(callback)
+                if key in subscribed:
+                    last = self._ws_last_tick[mode].get(key)
+                    if last is not None and time.monotonic() - last[0] <= self.WS_TICK_MAX_AGE:
+                        cached_ticks.append(last[1])
+                elif key not in pending:
+                    pending.add(key)
+                    new_instruments.append(instrument)
+        for data in cached_ticks:
+            callback(data)
+        return new_instruments
+
+    def _ws_release(self, mode: str, instruments: list, callback: Optional[Callable]) -> list:
+        """Remove callback (if given) from the given instruments
+
+        Returns the instruments nobody listens to any more, which can be
+        unsubscribed on the server.
+        """
+        released = []
+        with self._ws_lock:
+            listeners = self._ws_listeners[mode]
+            for instrument in instruments:
+                key = (instrument.get("exchange"), instrument.get("symbol"))
+                callbacks = listeners.get(key)
+                if callbacks and callback in callbacks:
+                    callbacks.remove(callback)
+                if callbacks:
+                    continue
+                listeners.pop(key, None)
+                self._ws_subscribed[mode].discard(key)
+                self._ws_pending[mode].discard(key)
+                self._ws_last_tick[mode].pop(key, None)
+                released.append(instrument)
+        return released
+
+    def _ws_send_subscribe(self, mode: str, instruments: list) -> bool:
+        """Send a subscribe for pending instruments and settle them
+
+        The SDK returns False rather than raising when the subscribe is not
+        sent. Accepted instruments become subscribed; on failure they are
+        dropped along with their listeners, so the next request retries.
+        """
+        ok = False
+        try:
+            ok = getattr(self.client, _WS_SUBSCRIBE[mode])(
+                instruments, on_data_received=self._ws_handlers[mode]
+            ) is not False
+        finally:
+            with self._ws_lock:
+                pending = self._ws_pending[mode]
+                for instrument in instruments:
+                    key = (instrument.get("exchange"), instrument.get("symbol"))
+                    if key not in pending:
+                        continue  # Released while in flight
+                    pending.discard(key)
+                    if ok:
+                        self._ws_subscribed[mode].add(key)
+                    else:
+                        self._ws_listeners[mode].pop(key, None)
+        return ok
+
+    def ws_remove_listener(self, mode: str, exchange: str, symbol: str, callback: Callable):
+        """Stop passing ticks of one instrument to callback"""
+        with self._ws_lock:
+            listeners = self._ws_listeners[mode].get((exchange, symbol))
+            if listeners and callback in listeners:
+                listeners.remove(callback)
+                if not listeners:
+                    del self._ws_listeners[mode][(exchange, symbol)]
+
+    def ws_subscribe_batched(self, mode: str, exchange: str, symbol: str, callback: Callable):
+        """
+        Subscribe one instrument, coalescing with other pending subscribes
+
+        The subscribe is sent from a background thread together with any other
+        requests queued within WS_BATCH_INTERVAL, one SDK call per mode.
+
+        Args:
+            mode: "ltp", "quote" or "depth"
+            exchange: Exchange code
+            symbol: Trading symbol
+            callback: Function called on data for this instrument: callback(data)
+        """
+        if not self._ws_connected:
+            self.ws_connect()
+        instrument = ws_instrument(exchange, symbol)
+        if not self._ws_add_listener(mode, [instrument], callback):
+            return  # Already streaming
+        with self._ws_lock:
+            self._ws_queue.put((mode, instrument))
+            if self._ws_batch_thread is None:
+                self._ws_batch_thread = threading.Thread(
+                    target=self._ws_batch_loop, name="ws-subscribe", daemon=True
+                )
+                self._ws_batch_thread.start()
+
+    def ws_first_tick(self, mode: str, exchange: str, symbol: str, timeout: float) -> Optional[dict]:
+        """
+        Subscribe one instrument (batched) and wait for a tick
+
+        Returns the next tick (or the latest cached one if the instrument is
+        already streaming and the tick is recent), or None if nothing arrives
+        within timeout.
+        """
+        ticks: queue.SimpleQueue = queue.SimpleQueue()
+        listener = ticks.put
+        self.ws_subscribe_batched(mode, exchange, symbol, listener)
+        try:
+            return ticks.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        finally:
+            self.ws_remove_listener(mode, exchange, symbol, listener)
+
+    def _ws_batch_loop(self):
+        """Send queued subscribes in batches until the queue stays idle"""
+        while True:
+            try:
+                mode, instrument = self._ws_queue.get(timeout=self.WS_BATCH_IDLE_TIMEOUT)
+            except queue.Empty:
+                with self._ws_lock:
+                    if self._ws_queue.empty():
+                        self._ws_batch_thread = None
+                        return
+                continue
+
+            batches: Dict[str, List[dict]] = {mode: [instrument]}
+            count = 1
+            deadline = time.monotonic() + self.WS_BATCH_INTERVAL
+            while count < self.WS_MAX_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    mode, instrument = self._ws_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batches.setdefault(mode, []).append(instrument)
+                count += 1
+
+            for mode, instruments in batches.items():
+                try:
+                    if not self._ws_send_subscribe(mode, instruments):
+                        logger.error("WebSocket %s subscribe failed", mode)
+                except Exception as e:
+                    logger.error(f"WebSocket {mode} subscribe failed: {e}")
+
     def ws_subscribe_ltp(
         self,
         instruments: list,
@@ -457,11 +682,19 @@ class OpenAlgoClient:
         """
         if not self._ws_connected:
             self.ws_connect()
-        self.client.subscribe_ltp(instruments, on_data_received=callback)
+        instruments = self._ws_add_listener("ltp", instruments, callback)
+        if instruments:
+            self._ws_send_subscribe("ltp", instruments)
+
+    def ws_unsubscribe_ltp(self, instruments: list, callback: Optional[Callable] = None):
+        """Unsubscribe from LTP streaming
 
-    def ws_unsubscribe_ltp(self, instruments: list):
-        """Unsubscribe from LTP streaming"""
-        self.client.unsubscribe_ltp(instruments)
+        callback is the listener to remove; instruments that still have other
+        listeners stay subscribed.
+        """
+        instruments = self._ws_release("ltp", instruments, callback)
+        if instruments:
+            self.client.unsubscribe_ltp(instruments)
 
     def ws_subscribe_quote(
         self,
@@ -477,11 +710,19 @@ class OpenAlgoClient:
         """
         if not self._ws_connected:
             self.ws_connect()
-        self.client.subscribe_quote(instruments, on_data_received=callback)
+        instruments = self._ws_add_listener("quote", instruments, callback)
+        if instruments:
+            self._ws_send_subscribe("quote", instruments)
 
-    def ws_unsubscribe_quote(self, instruments: list):
-        """Unsubscribe from Quote streaming"""
-        self.client.unsubscribe_quote(instruments)
+    def ws_unsubscribe_quote(self, instruments: list, callback: Optional[Callable] = None):
+        """Unsubscribe from Quote streaming
+
+        callback is the listener to remove; instruments that still have other
+        listeners stay subscribed.
+        """
+        instruments = self._ws_release("quote", instruments, callback)
+        if instruments:
+            self.client.unsubscribe_quote(instruments)
 
     def ws_subscribe_depth(
         self,
@@ -497,11 +738,19 @@ class OpenAlgoClient:
         """
         if not self._ws_connected:
             self.ws_connect()
-        self.client.subscribe_depth(instruments, on_data_received=callback)
+        instruments = self._ws_add_listener("depth", instruments, callback)
+        if instruments:
+            self._ws_send_subscribe("depth", instruments)
+
+    def ws_unsubscribe_depth(self, instruments: list, callback: Optional[Callable] = None):
+        """Unsubscribe from Depth streaming
 
-    def ws_unsubscribe_depth(self, instruments: list):
-        """Unsubscribe from Depth streaming"""
-        self.client.unsubscribe_depth(instruments)
+        callback is the listener to remove; instruments that still have other
+        listeners stay subscribed.
+        """
+        instruments = self._ws_release("depth", instruments, callback)
+        if instruments:
+            self.client.unsubscribe_depth(instruments)
 
     def get_holidays(self, year: int) -> dict:
         """Get market holidays using SDK (deprecated - use holidays)"""
@@ -5,6 +5,7 @@ from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from datetime import datetime
 from typing import Optional
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,6 +14,7 @@ logger = logging.getLogger(__name__)
 class WorkflowScheduler:
     _instance: Optional["WorkflowScheduler"] = None
     _scheduler: Optional[AsyncIOScheduler] = None
+    _event_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -24,7 +26,12 @@ class WorkflowScheduler:
             jobstores = {
                 "default": SQLAlchemyJobStore(url=db_url)
             }
-            self._scheduler = AsyncIOScheduler(jobstores=jobstores)
+            try:
+                # Called from the app's lifespan, so this is the app loop
+                self._event_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self._event_loop = None
+            self._scheduler = AsyncIOScheduler(jobstores=jobstores, event_loop=self._event_loop)
             self._scheduler.start()
             logger.info("Scheduler started")
 
@@ -34,6 +41,13 @@ class WorkflowScheduler:
             raise RuntimeError("Scheduler not initialized. Call init() first.")
         return self._scheduler
 
+    @property
+    def event_loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """Event loop the scheduler was started on, if initialized"""
+        if self._scheduler is None:
+            return None
+        return self._event_loop
+
     def add_workflow_job(
         self,
         workflow_id: int,
@@ -2,27 +2,304 @@
 Workflow Executor Service
 Executes workflow nodes using the OpenAlgo Python SDK
 """
-from datetime import datetime, time
-from typing import Optional, Dict, Any, List, Set, Tuple
+from datetime import datetime, time, timezone
+from typing import Optional, Dict, Any, List, Set, Tuple, Callable
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, true
+from sqlalchemy.orm import load_only
 import logging
 import asyncio
+import ast
+import atexit
 import re
 import json
+import operator
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict
+from operator import itemgetter
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+import time as time_module
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from app.core.database import async_session_maker
-from app.core.openalgo import OpenAlgoClient
+from app.core.openalgo import OpenAlgoClient, ws_instrument
 from app.core.scheduler import workflow_scheduler
 from app.core.encryption import decrypt_safe
 from app.models.workflow import Workflow, WorkflowExecution
 from app.models.settings import AppSettings
-from app.api.websocket import broadcast_execution_update
+from app.api.websocket import broadcast_execution_update, queue_execution_update, manager as ws_manager
 from app.services.price_monitor import get_price_monitor
 
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
+# Matches {{variable}} / {{path.to.value}} templates
+_TEMPLATE_RE = re.compile(r"\{\{([^}]+)\}\}")
+
+# Index underlyings traded on BSE (BSE_INDEX / BFO); everything else is NSE_INDEX / NFO
+_BSE_UNDERLYINGS = frozenset({"SENSEX", "BANKEX", "SENSEX50"})
+
+# Contract lot sizes per index underlying (default 75)
+_LOT_SIZES = {
+    "NIFTY": 75, "BANKNIFTY": 30, "FINNIFTY": 65,
+    "MIDCPNIFTY": 120, "NIFTYNXT50": 25,
+    "SENSEX": 20, "BANKEX": 30, "SENSEX50": 25
+}
+
+# Multi-leg option strategies as (offset, option_type, action) legs, where
+# "action" means the node's own action. Strategies in _ACTION_VARIANT_STRATEGIES
+# have separate _SELL / _BUY templates.
+_STRATEGY_TEMPLATES: Dict[str, Tuple[Tuple[str, str, str], ...]] = {
+    # ATM CE + ATM PE (same action)
+    "straddle": (("ATM", "CE", "action"), ("ATM", "PE", "action")),
+    # OTM CE + OTM PE (same action)
+    "strangle": (("OTM2", "CE", "action"), ("OTM2", "PE", "action")),
+    # Sell OTM CE + Sell OTM PE + Buy further OTM CE + Buy further OTM PE
+    "iron_condor_SELL": (
+        ("OTM5", "CE", "SELL"), ("OTM5", "PE", "SELL"),
+        ("OTM10", "CE", "BUY"), ("OTM10", "PE", "BUY"),
+    ),
+    "iron_condor_BUY": (
+        ("OTM5", "CE", "BUY"), ("OTM5", "PE", "BUY"),
+        ("OTM10", "CE", "SELL"), ("OTM10", "PE", "SELL"),
+    ),
+    # Sell ATM CE + Sell ATM PE + Buy OTM CE + Buy OTM PE
+    "iron_butterfly_SELL": (
+        ("ATM", "CE", "SELL"), ("ATM", "PE", "SELL"),
+        ("OTM3", "CE", "BUY"), ("OTM3", "PE", "BUY"),
+    ),
+    "iron_butterfly_BUY": (
+        ("ATM", "CE", "BUY"), ("ATM", "PE", "BUY"),
+        ("OTM3", "CE", "SELL"), ("OTM3", "PE", "SELL"),
+    ),
+    # Buy lower strike CE + Sell higher strike CE
+    "bull_call_spread": (("ATM", "CE", "BUY"), ("OTM3", "CE", "SELL")),
+    # Buy higher strike PE + Sell lower strike PE
+    "bear_put_spread": (("ATM", "PE", "BUY"), ("OTM3", "PE", "SELL")),
+    # Sell higher strike PE + Buy lower strike PE
+    "bull_put_spread": (("ATM", "PE", "SELL"), ("OTM3", "PE", "BUY")),
+    # Sell lower strike CE + Buy higher strike CE
+    "bear_call_spread": (("ATM", "CE", "SELL"), ("OTM3", "CE", "BUY")),
+}
+_ACTION_VARIANT_STRATEGIES = frozenset({"iron_condor", "iron_butterfly"})
+
+# Expiry dates as returned by the expiry API: "10-JUL-25" or "25DEC25"
+_EXPIRY_RE = re.compile(r"^(\d{1,2})-?([A-Za-z]{3})-?(\d{2})$")
+_MONTHS = {
+    "JAN": 1, "FEB": 2, "MAR": 3, "APR": 4, "MAY": 5, "JUN": 6,
+    "JUL": 7, "AUG": 8, "SEP": 9, "OCT": 10, "NOV": 11, "DEC": 12,
+}
+
+# Numeric strings: plain digits, and anything float() should parse (sign,
+# decimals, exponent, surrounding whitespace). Excludes inf/nan.
+_INT_RE = re.compile(r"^\d+$")
+_NUMBER_RE = re.compile(r"^\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*$")
+
+# Nodes that read fields, make one SDK call and store the result. Each field is
+# (node data key, SDK keyword, kind, default); "log" is formatted with the SDK
+# keywords and "result" with the call result; "checked" nodes log "result" as a
+# label via _finish, so failed calls are logged as errors. "cache" names a
+# reference-data TTL cache in NodeExecutor._CACHES.
+_NODE_SPECS: Dict[str, dict] = {
+    "placeOrder": {
+        "client": "place_order",
+        "fields": (
+            ("symbol", "symbol", "str", ""),
+            ("exchange", "exchange", "str", "NSE"),
+            ("action", "action", "str", "BUY"),
+            ("quantity", "quantity", "int", 1),
+            ("priceType", "price_type", "str", "MARKET"),
+            ("product", "product", "str", "MIS"),
+            ("price", "price", "float", 0),
+            ("triggerPrice", "trigger_price", "float", 0),
+        ),
+        "log": "Placing order: {symbol} {action} qty={quantity}",
+        "result": "Order result",
+        "checked": True,
+    },
+    "smartOrder": {
+        "client": "place_smart_order",
+        "fields": (
+            ("symbol", "symbol", "str", ""),
+            ("exchange", "exchange", "str", "NSE"),
+            ("action", "action", "str", "BUY"),
+            ("quantity", "quantity", "int", 1),
+            ("positionSize", "position_size", "int", 0),
+            ("priceType", "price_type", "str", "MARKET"),
+            ("product", "product", "str", "MIS"),
+            ("price", "price", "float", 0),
+            ("triggerPrice", "trigger_price", "float", 0),
+        ),
+        "log": "Placing smart order: {symbol} {action}",
+        "result": "Smart order result",
+        "checked": True,
+    },
+    "splitOrder": {
+        "client": "split_order",
+        "fields": (
+            ("symbol", "symbol", "str", ""),
+            ("exchange", "exchange", "str", "NSE"),
+            ("action", "action", "str", "BUY"),
+            ("quantity", "quantity", "int", 1),
+            ("splitSize", "splitsize", "int", 10),
+            ("priceType", "price_type", "str", "MARKET"),
+            ("product", "product", "str", "MIS"),
+        ),
+        "log": "Placing split order: {symbol} qty={quantity} split={splitsize}",
+        "result": "Split order result",
+        "checked": True,
+    },
+    "getDepth": {
+        "client": "get_depth",
+        "fields": (
+            ("symbol", "symbol", "str", ""),
+            ("exchange", "exchange", "str", "NSE"),
+        ),
+        "log": "Getting depth for: {symbol} ({exchange})",
+        "result": "Depth result received",
+    },
+    "openPosition": {
+        "client": "get_open_position",
+        "fields": (
+            ("symbol", "symbol", "str", ""),
+            ("exchange", "exchange", "str", "NSE"),
+            ("product", "product", "str", "MIS"),
+        ),
+        "log": "Getting open position for: {symbol}",
+        "result": "Open position result: {result}",
+    },
+    "expiry": {
+        "client": "get_expiry",
+        "fields": (
+            ("symbol", "symbol", "str", "NIFTY"),
+            ("exchange", "exchange", "str", "NFO"),
+            ("instrumentType", "instrumenttype", "str", "options"),
+        ),
+        "log": "Getting expiry dates for: {symbol}",
+        "result": "Expiry result: {result}",
+    },
+    "symbol": {
+        "client": "symbol",
+        "fields": (
+            ("symbol", "symbol", "str", ""),
+            ("exchange", "exchange", "str", "NSE"),
+        ),
+        "log": "Getting symbol info for: {symbol} ({exchange})",
+        "result": "Symbol result: {result}",
+        "cache": "symbol",
+    },
+    "optionSymbol": {
+        "client": "optionsymbol",
+        "fields": (
+            ("underlying", "underlying", "str", "NIFTY"),
+            ("exchange", "exchange", "str", "NSE_INDEX"),
+            ("expiryDate", "expiry_date", "str", ""),
+            ("offset", "offset", "str", "ATM"),
+            ("optionType", "option_type", "str", "CE"),
+        ),
+        "log": "Resolving option symbol: {underlying} {option_type} {offset}",
+        "result": "Option symbol result: {result}",
+    },
+    "syntheticFuture": {
+        "client": "syntheticfuture",
+        "fields": (
+            ("underlying", "underlying", "str", "NIFTY"),
+            ("exchange", "exchange", "str", "NSE_INDEX"),
+            ("expiryDate", "expiry_date", "str", ""),
+        ),
+        "log": "Calculating synthetic future for: {underlying}",
+        "result": "Synthetic future result: {result}",
+    },
+    "optionChain": {
+        "client": "optionchain",
+        "fields": (
+            ("underlying", "underlying", "str", "NIFTY"),
+            ("exchange", "exchange", "str", "NSE_INDEX"),
+            ("expiryDate", "expiry_date", "str", ""),
+            ("strikeCount", "strike_count", "int", 10),
+        ),
+        "log": "Fetching option chain for: {underlying} expiry={expiry_date}",
+        "result": "Option chain result received",
+    },
+}
+
+# Field schemas for handlers with custom logic, same (key, SDK keyword, kind,
+# default) layout as _NODE_SPECS fields; read with NodeExecutor._extract
+_ARG_SCHEMA: Dict[str, Tuple[Tuple[str, str, str, Any], ...]] = {
+    "history": (
+        ("symbol", "symbol", "str", ""),
+        ("exchange", "exchange", "str", "NSE"),
+        ("interval", "interval", "str", "5m"),
+        ("startDate", "start_date", "str", ""),
+        ("endDate", "end_date", "str", ""),
+    ),
+    "modifyOrder": (
+        ("orderId", "order_id", "str", ""),
+        ("symbol", "symbol", "str", ""),
+        ("exchange", "exchange", "str", "NSE"),
+        ("action", "action", "str", "BUY"),
+        ("quantity", "quantity", "int", 1),
+        ("priceType", "price_type", "str", "LIMIT"),
+        ("product", "product", "str", "MIS"),
+        ("price", "price", "float", 0),
+        ("triggerPrice", "trigger_price", "float", 0),
+    ),
+    # Passed straight through to options_order; underlying, expiry and lots
+    # are resolved separately
+    "optionsOrder": (
+        ("offset", "offset", "str", "ATM"),
+        ("optionType", "option_type", "str", "CE"),
+        ("action", "action", "str", "BUY"),
+        ("priceType", "price_type", "str", "MARKET"),
+        ("product", "product", "str", "NRML"),
+        ("splitSize", "splitsize", "int", 0),
+    ),
+}
+
+# Read-only lookups that can be fetched ahead when several follow each other
+# in a chain: node type -> (SDK method, fields)
+_PREFETCH_CALLS: Dict[str, Tuple[str, Tuple[Tuple[str, str, str, Any], ...]]] = {
+    "symbol": (_NODE_SPECS["symbol"]["client"], _NODE_SPECS["symbol"]["fields"]),
+    "optionSymbol": (_NODE_SPECS["optionSymbol"]["client"], _NODE_SPECS["optionSymbol"]["fields"]),
+    "history": ("get_history", _ARG_SCHEMA["history"]),
+    "orderBook": ("orderbook", ()),
+    "tradeBook": ("tradebook", ()),
+    "positionBook": ("positionbook", ()),
+    "holdings": ("holdings", ()),
+    "funds": ("funds", ()),
+}
+
+# SDK reads whose response does not change within one run, so repeat nodes
+# with the same arguments reuse it. Books, funds and quotes change with
+# orders placed mid-run, and history gains candles across delay nodes.
+_RUN_MEMO_METHODS = frozenset({"get_expiry"})
+
+# Built-in {{variables}}, formatted from a single datetime.now() per interpolation
+_BUILTIN_FORMATTERS: Dict[str, Callable[[datetime], str]] = {
+    "timestamp": lambda now: now.strftime("%Y-%m-%d %H:%M:%S"),
+    "date": lambda now: now.strftime("%Y-%m-%d"),
+    "time": lambda now: now.strftime("%H:%M:%S"),
+    "year": lambda now: now.strftime("%Y"),
+    "month": lambda now: now.strftime("%m"),
+    "day": lambda now: now.strftime("%d"),
+    "hour": lambda now: now.strftime("%H"),
+    "minute": lambda now: now.strftime("%M"),
+    "second": lambda now: now.strftime("%S"),
+    "weekday": lambda now: now.strftime("%A"),
+    "iso_timestamp": lambda now: now.isoformat(),
+}
+
+
+# HH, HH:MM or HH:MM:SS
+_TIME_RE = re.compile(r"^\s*(\d+)(?::(\d+)(?::(\d+))?)?\s*$")
+
 
 def parse_time_string(time_str: str, default_hour: int = 9, default_minute: int = 15) -> Tuple[int, int, int]:
     """Safely parse a time string in HH:MM or HH:MM:SS format.
@@ -32,6 +309,17 @@ def parse_time_string(time_str: str, default_hour: int = 9, default_minute: int
     if not time_str or not isinstance(time_str, str):
         return (default_hour, default_minute, 0)
 
+    # Fast path for well-formed H[:M[:S]] strings
+    match = _TIME_RE.match(time_str)
+    if match:
+        hour, minute, second = match.groups()
+        return (
+            min(23, int(hour)),
+            min(59, int(minute)) if minute else default_minute,
+            min(59, int(second)) if second else 0,
+        )
+
+    # Partially valid input: default each unparseable part individually
     try:
         parts = time_str.strip().split(":")
         if not parts:
@@ -52,21 +340,214 @@ def parse_time_string(time_str: str, default_hour: int = 9, default_minute: int
         return (default_hour, default_minute, 0)
 
 
+@lru_cache(maxsize=256)
+def _parse_time_cached(time_str: str, default_hour: int, default_minute: int) -> time:
+    """Parse an HH:MM[:SS] string into a time, memoized per distinct string"""
+    return time(*parse_time_string(time_str, default_hour, default_minute))
+
+
+def parse_time_of_day(time_str: Any, default_hour: int = 9, default_minute: int = 15) -> time:
+    """Safely parse a time string into a datetime.time (see parse_time_string)"""
+    if isinstance(time_str, str):
+        return _parse_time_cached(time_str, default_hour, default_minute)
+    return time(*parse_time_string(time_str, default_hour, default_minute))
+
+
+def _seconds_of_day(t: time) -> int:
+    """Seconds since midnight for a time or datetime"""
+    return t.hour * 3600 + t.minute * 60 + t.second
+
+
+@lru_cache(maxsize=256)
+def _parse_seconds_cached(time_str: str, default_hour: int, default_minute: int) -> int:
+    return _seconds_of_day(_parse_time_cached(time_str, default_hour, default_minute))
+
+
+def parse_seconds_of_day(time_str: Any, default_hour: int = 9, default_minute: int = 15) -> int:
+    """Seconds since midnight for a time string (see parse_time_string)"""
+    if isinstance(time_str, str):
+        return _parse_seconds_cached(time_str, default_hour, default_minute)
+    return _seconds_of_day(parse_time_of_day(time_str, default_hour, default_minute))
+
+
+def _to_float(value: Any, default: float) -> float:
+    """float(value), or default when value is None or ""; floats pass through unconverted
+
+    Zero is a value, not a missing one: multiplying by 0 gives 0.
+    """
+    if type(value) is float:
+        return value
+    if value is None or value == "":
+        return default
+    return float(value)
+
+
+_JSON_CLOSERS = {"{": "}", "[": "]"}
+
+
+def _maybe_json(text: str) -> Any:
+    """Parse text as JSON if it is shaped like an object or array, else return it
+
+    Parsed values are not cached: callers may mutate the returned object.
+    """
+    stripped = text.strip()
+    if len(stripped) < 2 or _JSON_CLOSERS.get(stripped[0]) != stripped[-1]:
+        return text
+    try:
+        return orjson.loads(stripped)
+    except orjson.JSONDecodeError:
+        return text
+
+
+def _last_expiry_in_month(
+    valid_expiries: List[Tuple[str, datetime]], year: int, month: int
+) -> Optional[str]:
+    """Last expiry in the given month from a date-sorted (raw, parsed) list"""
+    month_end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+    idx = bisect_left(valid_expiries, month_end, key=itemgetter(1)) - 1
+    if idx >= 0:
+        exp_str, exp_date = valid_expiries[idx]
+        if exp_date.year == year and exp_date.month == month:
+            return exp_str
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _split_path(var_path: str) -> Tuple[str, ...]:
+    """Split a dotted variable path like 'order.data.status' into its parts"""
+    return tuple(var_path.split("."))
+
+
+# Operators allowed in Math Expression nodes
+_MATH_OPERATORS = (
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Mod, ast.Pow, ast.USub, ast.UAdd,
+)
+_NO_BUILTINS = {"__builtins__": {}}
+_INF = float("inf")
+
+
+def _validate_math(node: ast.expr, names: frozenset = frozenset()):
+    """Reject anything but numbers, arithmetic and the given names, so the expression is safe to eval"""
+    if isinstance(node, ast.Name) and node.id in names:
+        pass
+    elif isinstance(node, ast.Constant):
+        if not isinstance(node.value, (int, float)):
+            raise ValueError(f"Unsupported constant: {node.value}")
+    elif isinstance(node, ast.BinOp):
+        _validate_math(node.left, names)
+        _validate_math(node.right, names)
+        if not isinstance(node.op, _MATH_OPERATORS):
+            raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+    elif isinstance(node, ast.UnaryOp):
+        _validate_math(node.operand, names)
+        if not isinstance(node.op, _MATH_OPERATORS):
+            raise ValueError(f"Unsupported unary operator: {type(node.op).__name__}")
+    else:
+        raise ValueError(f"Unsupported expression type: {type(node).__name__}")
+
+
+def _compile_math(expression: str):
+    """Validate and compile a math expression"""
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid expression syntax: {e}")
+    _validate_math(tree.body)
+    return compile(tree, "<math>", "eval")
+
+
+@lru_cache(maxsize=512)
+def _eval_math_text(expression: str) -> float:
+    """Value of a placeholder-free math expression, folded once per distinct text"""
+    return float(eval(_compile_math(expression), _NO_BUILTINS))
+
+
+@lru_cache(maxsize=1024)
+def _parse_template(text: str) -> Tuple[Tuple[Tuple[str, str, str, Tuple[str, ...]], ...], str]:
+    """Split a template into (literal, placeholder, var_path, path parts) pieces and a tail
+
+    Node fields are re-interpolated on every run and loop iteration, so the
+    regex scan happens once per distinct template string.
+    """
+    pieces = []
+    pos = 0
+    for match in _TEMPLATE_RE.finditer(text):
+        var_path = match.group(1).strip()
+        pieces.append((text[pos:match.start()], match.group(0), var_path, _split_path(var_path)))
+        pos = match.end()
+    return tuple(pieces), text[pos:]
+
+
+@lru_cache(maxsize=512)
+def _compile_math_template(expression: str) -> Optional[Tuple[Any, Tuple[Tuple[str, ...], ...]]]:
+    """Compile a math template with its {{placeholders}} bound as variables _v0, _v1, ...
+
+    Returns (code, variable paths), or None when the template only works as
+    text after interpolation (builtins, placeholders glued to digits, ...).
+    """
+    pieces, tail = _parse_template(expression)
+    if not pieces or any(var_path in _BUILTIN_FORMATTERS for _, _, var_path, _ in pieces):
+        return None
+    source = "".join(f"{literal} _v{i} " for i, (literal, _, _, _) in enumerate(pieces)) + tail
+    try:
+        tree = ast.parse(source.strip(), mode="eval")
+        _validate_math(tree.body, frozenset(f"_v{i}" for i in range(len(pieces))))
+    except (SyntaxError, ValueError):
+        return None
+    return compile(tree, "<math>", "eval"), tuple(path for _, _, _, path in pieces)
+
+
 # Execution locks to prevent concurrent execution of the same workflow
 _workflow_locks: Dict[int, asyncio.Lock] = {}
 _workflow_locks_lock = threading.Lock()  # Thread-safe access to locks dict
+MAX_WORKFLOW_LOCKS = 4096  # Idle locks beyond this are dropped, oldest first
 
 # Execution limits
 MAX_NODE_DEPTH = 100  # Maximum recursion depth for node chain
 MAX_NODE_VISITS = 500  # Maximum total node visits per execution
+MAX_NODE_WORKERS = 8  # Maximum concurrent blocking node handlers (broker calls)
+MAX_PREFETCH_RUN = 50  # Maximum lookups fetched ahead at once
+
+# Node types that can start a workflow
+_TRIGGER_TYPES = frozenset({"start", "webhookTrigger", "priceAlert"})
+
+# Worker threads for blocking node handlers. Kept separate from the loop's
+# default executor, which APScheduler uses to run execute_workflow_sync; a
+# scheduled run blocks a default-executor thread while its nodes execute.
+_node_pool = ThreadPoolExecutor(max_workers=MAX_NODE_WORKERS, thread_name_prefix="node-exec")
+
+
+def _utcnow() -> datetime:
+    """Current time as the naive UTC datetime the models store"""
+    return datetime.now(_UTC).replace(tzinfo=None)
+
+
+def _format_log_times(logs: List[dict]) -> List[dict]:
+    """Convert raw epoch-nanosecond log timestamps to the naive UTC ISO strings that are stored"""
+    return [
+        {**entry, "time": datetime.fromtimestamp(entry["time"] / 1e9, _UTC).replace(tzinfo=None).isoformat()}
+        if isinstance(entry["time"], int) else entry
+        for entry in logs
+    ]
 
 
 def get_workflow_lock(workflow_id: int) -> asyncio.Lock:
     """Get or create an asyncio lock for a workflow"""
+    # Lock-free fast path: dict reads are atomic under the GIL
+    lock = _workflow_locks.get(workflow_id)
+    if lock is not None:
+        return lock
     with _workflow_locks_lock:
-        if workflow_id not in _workflow_locks:
-            _workflow_locks[workflow_id] = asyncio.Lock()
-        return _workflow_locks[workflow_id]
+        lock = _workflow_locks.setdefault(workflow_id, asyncio.Lock())
+        if len(_workflow_locks) > MAX_WORKFLOW_LOCKS:
+            # Dicts keep insertion order; only idle locks are safe to drop,
+            # a later run simply gets a fresh one
+            for stale_id in [
+                wid for wid, stale in _workflow_locks.items()
+                if wid != workflow_id and not stale.locked()
+            ][:len(_workflow_locks) - MAX_WORKFLOW_LOCKS]:
+                del _workflow_locks[stale_id]
+        return lock
 
 
 class WorkflowContext:
@@ -92,73 +573,211 @@ class WorkflowContext:
         """Get the condition result for a node"""
         return self.condition_results.get(node_id)
 
-    def _get_builtin_variable(self, name: str) -> Optional[str]:
-        """Get built-in system variables"""
-        now = datetime.now()
-        builtins = {
-            "timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
-            "date": now.strftime("%Y-%m-%d"),
-            "time": now.strftime("%H:%M:%S"),
-            "year": now.strftime("%Y"),
-            "month": now.strftime("%m"),
-            "day": now.strftime("%d"),
-            "hour": now.strftime("%H"),
-            "minute": now.strftime("%M"),
-            "second": now.strftime("%S"),
-            "weekday": now.strftime("%A"),
-            "iso_timestamp": now.isoformat(),
-        }
-        return builtins.get(name)
+    def lookup(self, path: Tuple[str, ...]) -> Any:
+        """Resolve a split variable path like ('order', 'data', 'status'), or None"""
+        value = self.variables
+        for part in path:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(part)
+            if value is None:
+                return None
+        return value
 
     def interpolate(self, text: str) -> str:
         """Replace {{variable}} patterns with actual values"""
-        if not isinstance(text, str):
+        if not isinstance(text, str) or "{{" not in text:
             return text
 
-        def replacer(match):
-            var_path = match.group(1).strip()
+        pieces, tail = _parse_template(text)
+        # Read the clock at most once per call, and only if a builtin is used
+        now = None
+        out = []
+        for literal, placeholder, var_path, path in pieces:
+            out.append(literal)
 
             # Check built-in variables first
-            builtin_value = self._get_builtin_variable(var_path)
-            if builtin_value is not None:
-                return builtin_value
+            formatter = _BUILTIN_FORMATTERS.get(var_path)
+            if formatter is not None:
+                if now is None:
+                    now = datetime.now()
+                out.append(formatter(now))
+                continue
 
             # Then check user variables
-            parts = var_path.split(".")
-            value = self.variables
+            value = self.lookup(path)
+            out.append(str(value) if value is not None else placeholder)  # Keep original if not found
+
+        out.append(tail)
+        return "".join(out)
+
+
+# Shared HTTP session for HTTP Request nodes, created on first use. Keeps
+# connections alive across node executions instead of reconnecting per call.
+_http_session = None
+_http_session_lock = threading.Lock()
+
+_HTTP_METHODS = frozenset({"GET", "POST", "PUT", "DELETE", "PATCH"})
+_HTTP_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+
+def _get_http_session():
+    """Get the shared requests session, creating it on first use"""
+    global _http_session
+    if _http_session is not None:
+        return _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            # Retry only failures to connect, where nothing was sent; read
+            # errors are not retried so the timeout holds and no request
+            # reaches the server twice
+            adapter = HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=MAX_NODE_WORKERS,
+                max_retries=Retry(
+                    total=2, connect=2, read=0, status=0, other=0, backoff_factor=0.1
+                ),
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _http_session = session
+        return _http_session
 
-            for part in parts:
-                if isinstance(value, dict):
-                    value = value.get(part)
-                else:
-                    return match.group(0)  # Return original if not found
+# Client built from AppSettings, reused across executions until settings change
+_cached_client: Optional[OpenAlgoClient] = None
+_client_generation = 0  # Bumped on invalidation so in-flight fills are discarded
+_client_cache_lock = threading.Lock()
 
-                if value is None:
-                    return match.group(0)
 
-            return str(value) if value is not None else match.group(0)
+def invalidate_client_cache():
+    """Drop the cached OpenAlgo client (call after settings are updated)
 
-        return re.sub(r"\{\{([^}]+)\}\}", replacer, text)
+    The old client's WebSocket connection is closed so it doesn't outlive it.
+    """
+    global _cached_client, _client_generation
+    with _client_cache_lock:
+        old_client = _cached_client
+        _cached_client = None
+        _client_generation += 1
+    if old_client is not None and old_client.ws_is_connected():
+        old_client.ws_disconnect()
 
 
 async def get_openalgo_client() -> Optional[OpenAlgoClient]:
-    """Get OpenAlgo client from settings"""
+    """Get OpenAlgo client from settings
+
+    The client (and the decrypted API key inside it) is cached at module
+    level, so executions after the first skip the settings query and decrypt.
+    """
+    client = _cached_client
+    if client is not None:
+        return client
+
+    generation = _client_generation
     async with async_session_maker() as db:
-        result = await db.execute(select(AppSettings).limit(1))
-        settings = result.scalar_one_or_none()
+        result = await db.execute(
+            select(AppSettings.openalgo_api_key, AppSettings.openalgo_host).limit(1)
+        )
+        settings = result.one_or_none()
 
-        if not settings or not settings.openalgo_api_key:
-            return None
+    if not settings:
+        return None
+    return _client_from_settings(settings.openalgo_api_key, settings.openalgo_host, generation)
 
-        # Decrypt the API key
-        api_key = decrypt_safe(settings.openalgo_api_key)
-        if not api_key:
-            logger.error("Failed to decrypt API key")
-            return None
 
-        return OpenAlgoClient(
-            api_key=api_key, host=settings.openalgo_host
-        )
+def _client_from_settings(
+    encrypted_key: Optional[str], host: Optional[str], generation: int
+) -> Optional[OpenAlgoClient]:
+    """Build the client from stored settings and cache it
+
+    generation is the cache generation read before the settings were queried.
+    """
+    global _cached_client
+    if not encrypted_key:
+        return None
+
+    # Decrypt the API key
+    api_key = decrypt_safe(encrypted_key)
+    if not api_key:
+        logger.error("Failed to decrypt API key")
+        return None
+
+    client = OpenAlgoClient(api_key=api_key, host=host)
+
+    with _client_cache_lock:
+        if generation != _client_generation:
+            # Settings changed while we were reading them; don't cache
+            return client
+        if _cached_client is None:
+            _cached_client = client
+        return _cached_client
+
+
+# Traversal maps per workflow ID, keyed by the row's updated_at; the least
+# recently used entries are evicted beyond GRAPH_CACHE_SIZE
+GRAPH_CACHE_SIZE = 128
+_graph_cache: "OrderedDict[int, Tuple[Any, tuple]]" = OrderedDict()
+_graph_generation = 0  # Bumped on invalidation so rows read earlier aren't cached
+_graph_cache_lock = threading.Lock()
+
+
+def invalidate_graph_cache(workflow_id: int):
+    """Drop the cached traversal maps for a workflow (call after edits)"""
+    global _graph_generation
+    with _graph_cache_lock:
+        _graph_generation += 1
+        _graph_cache.pop(workflow_id, None)
+
+
+def _get_graph(workflow, generation: int) -> tuple:
+    """Traversal maps for a workflow row, reused while the row is unchanged
+
+    generation is the cache generation read before the row was queried; if
+    the workflow was edited since, the maps are built but not cached.
+    """
+    with _graph_cache_lock:
+        cached = _graph_cache.get(workflow.id)
+        if cached is not None and cached[0] == workflow.updated_at:
+            _graph_cache.move_to_end(workflow.id)
+            return cached[1]
+
+    graph = _build_graph(workflow.nodes or [], workflow.edges or [])
+
+    with _graph_cache_lock:
+        if generation == _graph_generation:
+            _graph_cache[workflow.id] = (workflow.updated_at, graph)
+            _graph_cache.move_to_end(workflow.id)
+            if len(_graph_cache) > GRAPH_CACHE_SIZE:
+                _graph_cache.popitem(last=False)
+    return graph
+
+
+def _build_graph(nodes: List[dict], edges: List[dict]) -> tuple:
+    """Build (start_node, nodes_by_id, edge_map, incoming_edge_map) for a workflow
+
+    The result is shared between runs, so callers must not mutate it.
+    """
+    # Find trigger node (start, webhookTrigger, or priceAlert)
+    start_node = next((n for n in nodes if n.get("type") in _TRIGGER_TYPES), None)
+
+    # Build edge map for traversal (source -> outgoing edges by handle)
+    edge_map: Dict[str, Dict[str, List[dict]]] = defaultdict(
+        lambda: {"yes": [], "no": [], "default": [], "all": []}
+    )
+    # Build reverse edge map (target -> incoming edges) for logic gates
+    incoming_edge_map: Dict[str, List[dict]] = defaultdict(list)
+    for edge in edges:
+        branches = edge_map[edge["source"]]
+        handle = edge.get("sourceHandle")
+        branches[handle if handle in ("yes", "no") else "default"].append(edge)
+        branches["all"].append(edge)
+        incoming_edge_map[edge["target"]].append(edge)
+
+    # Index nodes by ID; reversed so the first of any duplicate IDs wins
+    nodes_by_id = {n["id"]: n for n in reversed(nodes)}
+
+    return start_node, nodes_by_id, dict(edge_map), dict(incoming_edge_map)
 
 
 def run_sync(coro):
@@ -166,19 +785,159 @@ def run_sync(coro):
     return coro
 
 
+class TTLCache:
+    """Small thread-safe cache whose entries expire after ttl seconds
+
+    For slow-changing reference data (holidays, timings, symbol info) that
+    would otherwise be re-fetched on every node execution.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Any, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        """Cached value for key, or None if missing or expired"""
+        entry = self._data.get(key)
+        if entry is None or entry[0] < time_module.monotonic():
+            return None
+        return entry[1]
+
+    def set(self, key: Any, value: Any):
+        """Store value for key, evicting expired then oldest entries when full"""
+        now = time_module.monotonic()
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                for stale in [k for k, (expires, _) in self._data.items() if expires < now]:
+                    del self._data[stale]
+                if len(self._data) >= self.maxsize:
+                    del self._data[next(iter(self._data))]
+            self._data[key] = (now + self.ttl, value)
+
+
+# Reference data caches shared across executions
+_HOLIDAYS_CACHE = TTLCache(maxsize=8, ttl=86400)
+_TIMINGS_CACHE = TTLCache(maxsize=64, ttl=3600)
+_SYMBOL_CACHE = TTLCache(maxsize=4096, ttl=86400)
+
+
+class QuoteBatcher:
+    """Coalesces quote lookups for sibling nodes into one multiquotes call
+
+    When a node fans out to several price-checking nodes, their quotes are
+    fetched together up front. Each prefetched quote is handed out once per
+    requesting node and only while fresh; anything else falls back to an
+    individual get_quotes call.
+    """
+
+    # Node types that only read ltp/prev_close from a quote. Get Quote stores
+    # the full get_quotes response, whose fields differ from a multiquotes
+    # entry, so it always makes its own call.
+    NODE_TYPES = {"priceCondition", "priceAlert"}
+
+    # Seconds a prefetched quote stays usable
+    MAX_AGE = 1.0
+
+    def __init__(self, client: OpenAlgoClient):
+        self.client = client
+        self._quotes: Dict[Tuple[str, str], dict] = {}
+        self._remaining: Dict[Tuple[str, str], int] = {}
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()  # Handlers run in worker threads
+
+    def prefetch(self, pairs: List[Tuple[str, str]]) -> int:
+        """Fetch quotes for (symbol, exchange) pairs in a single request
+
+        Returns the number of distinct symbols fetched (0 if not worth batching).
+        """
+        pairs = [pair for pair in pairs if pair[0]]
+        unique = list(dict.fromkeys(pairs))
+        if len(unique) < 2:
+            return 0
+
+        try:
+            response = self.client.get_multi_quotes(
+                symbols=[{"symbol": symbol, "exchange": exchange} for symbol, exchange in unique]
+            )
+        except Exception as e:
+            logger.warning(f"Multi quotes prefetch failed: {e}")
+            return 0
+
+        if not isinstance(response, dict) or response.get("status") != "success":
+            return 0
+
+        quotes = {}
+        for item in response.get("results") or []:
+            key = (item.get("symbol"), item.get("exchange"))
+            data = item.get("data")
+            if key in unique and isinstance(data, dict):
+                quotes[key] = {"status": "success", "data": data}
+        remaining: Dict[Tuple[str, str], int] = {}
+        for pair in pairs:
+            if pair in quotes:
+                remaining[pair] = remaining.get(pair, 0) + 1
+
+        with self._lock:
+            self._quotes = quotes
+            self._remaining = remaining
+            self._fetched_at = time_module.monotonic()
+        return len(quotes)
+
+    def get_quotes(self, symbol: str, exchange: str) -> dict:
+        """Return a prefetched quote if one is pending, else fetch it"""
+        key = (symbol, exchange)
+        with self._lock:
+            if self._remaining.get(key) and time_module.monotonic() - self._fetched_at <= self.MAX_AGE:
+                self._remaining[key] -= 1
+                return self._quotes[key]
+        return self.client.get_quotes(symbol=symbol, exchange=exchange)
+
+
 class NodeExecutor:
     """Executes individual workflow nodes"""
 
+    # Comparison operators for condition nodes
+    _OPS: Dict[str, Callable[[Any, Any], bool]] = {
+        "gt": operator.gt,
+        "gte": operator.ge,
+        "lt": operator.lt,
+        "lte": operator.le,
+        "eq": operator.eq,
+        "neq": operator.ne,
+    }
+
+    # Numeric Variable operations: (function, operand if value is empty,
+    # whether the node value is the operand, log template, label on failure)
+    _ARITH_OPS: Dict[str, Tuple[Callable[[float, float], float], float, bool, str, str]] = {
+        "add": (operator.add, 0, True, "Added {operand} to {name}: {result}", "Add"),
+        "subtract": (operator.sub, 0, True, "Subtracted {operand} from {name}: {result}", "Subtract"),
+        "multiply": (operator.mul, 1, True, "Multiplied {name} by {operand}: {result}", "Multiply"),
+        "divide": (operator.truediv, 1, True, "Divided {name} by {operand}: {result}", "Divide"),
+        "increment": (operator.add, 1, False, "Incremented {name}: {result}", "Increment"),
+        "decrement": (operator.sub, 1, False, "Decremented {name}: {result}", "Decrement"),
+    }
+
     def __init__(self, client: OpenAlgoClient, context: WorkflowContext, logs: list):
         self.client = client
         self.context = context
         self.logs = logs
+        self.quotes = QuoteBatcher(client)
+        # Per-run expiry caches: (symbol, exchange) -> sorted expiries,
+        # (symbol, exchange, expiry_type) -> resolved API expiry string
+        self._expiry_cache: Dict[Tuple[str, str], List[Tuple[str, datetime]]] = {}
+        self._resolved_expiry_cache: Dict[Tuple[str, str, str], str] = {}
+        # SDK responses fetched ahead of their nodes, keyed by the identity of
+        # the node's data dict: id(node_data) -> ((method, kwargs), result)
+        self._prefetched: Dict[int, Tuple[Tuple[str, Tuple], Any]] = {}
+        # Successful responses of _RUN_MEMO_METHODS, reused for the rest of the run
+        self._run_memo: Dict[Tuple[str, Tuple], Any] = {}
 
     def log(self, message: str, level: str = "info"):
         """Add log entry"""
-        self.logs.append(
-            {"time": datetime.utcnow().isoformat(), "message": message, "level": level}
-        )
+        # Raw epoch nanoseconds; formatted once when the logs are persisted
+        self.logs.append({"time": time_module.time_ns(), "message": message, "level": level})
         if level == "error":
             logger.error(message)
         else:
@@ -191,122 +950,204 @@ class NodeExecutor:
             self.context.set_variable(output_var.strip(), result)
             self.log(f"Stored result in variable: {output_var}")
 
+    def _finish(self, label: str, result: dict, node_data: Optional[dict] = None) -> dict:
+        """Log an SDK call result (errors unless status is success), store and return it"""
+        self.log(f"{label}: {result}", "info" if result.get("status") == "success" else "error")
+        if node_data is not None:
+            self.store_output(node_data, result)
+        return result
+
     def interpolate_value(self, value: Any) -> Any:
         """Interpolate variables in a value (string, number, or keep as-is)"""
         if isinstance(value, str):
             interpolated = self.context.interpolate(value)
-            # Try to convert to number if it looks like one
-            if interpolated.isdigit():
+            # Convert to number if it looks like one
+            if _INT_RE.match(interpolated):
                 return int(interpolated)
-            try:
+            if _NUMBER_RE.match(interpolated):
                 return float(interpolated)
-            except ValueError:
-                return interpolated
+            return interpolated
         return value
 
     def get_str(self, node_data: dict, key: str, default: str = "") -> str:
         """Get interpolated string value from node data"""
         value = node_data.get(key, default)
-        return self.context.interpolate(str(value)) if value else default
+        if not value:
+            return default
+        text = str(value)
+        return self.context.interpolate(text) if "{{" in text else text
 
     def get_int(self, node_data: dict, key: str, default: int = 0) -> int:
         """Get interpolated integer value from node data"""
         value = node_data.get(key, default)
         if isinstance(value, str):
-            interpolated = self.context.interpolate(value)
-            try:
-                return int(float(interpolated))
-            except (ValueError, TypeError):
+            interpolated = self.context.interpolate(value) if "{{" in value else value
+            if not _NUMBER_RE.match(interpolated):
                 return default
+            return int(float(interpolated))
         return int(value) if value else default
 
     def get_float(self, node_data: dict, key: str, default: float = 0.0) -> float:
         """Get interpolated float value from node data"""
         value = node_data.get(key, default)
         if isinstance(value, str):
-            interpolated = self.context.interpolate(value)
-            try:
-                return float(interpolated)
-            except (ValueError, TypeError):
+            interpolated = self.context.interpolate(value) if "{{" in value else value
+            if not _NUMBER_RE.match(interpolated):
                 return default
+            return float(interpolated)
         return float(value) if value else default
 
-    def execute_place_order(self, node_data: dict) -> dict:
-        """Execute Place Order node - supports {{variable}} interpolation"""
-        symbol = self.get_str(node_data, "symbol", "")
-        exchange = self.get_str(node_data, "exchange", "NSE")
-        action = self.get_str(node_data, "action", "BUY")
-        quantity = self.get_int(node_data, "quantity", 1)
-        price_type = self.get_str(node_data, "priceType", "MARKET")
-        product = self.get_str(node_data, "product", "MIS")
-        price = self.get_float(node_data, "price", 0)
-        trigger_price = self.get_float(node_data, "triggerPrice", 0)
+    _GETTERS = {"str": get_str, "int": get_int, "float": get_float}
+    _CACHES = {"symbol": _SYMBOL_CACHE}
 
-        self.log(f"Placing order: {symbol} {action} qty={quantity}")
-        result = self.client.place_order(
-            symbol=symbol,
-            exchange=exchange,
-            action=action,
-            quantity=quantity,
-            price_type=price_type,
-            product=product,
-            price=price,
-            trigger_price=trigger_price,
-        )
-        self.log(
-            f"Order result: {result}",
-            "info" if result.get("status") == "success" else "error",
-        )
+    def _extract(self, node_data: dict, fields: Tuple[Tuple[str, str, str, Any], ...]) -> Dict[str, Any]:
+        """Read (key, SDK keyword, kind, default) fields into SDK keyword arguments"""
+        getters = self._GETTERS
+        return {
+            kwarg: getters[kind](self, node_data, key, default)
+            for key, kwarg, kind, default in fields
+        }
+
+    def _cached_call(self, cache: TTLCache, key: Any, node_data: dict, fetch: Callable[[], dict]) -> dict:
+        """Return a cached reference-data response, fetching it on a miss
+
+        Only successful responses are cached. Set dontUseCache on a node to
+        always fetch.
+        """
+        if not node_data.get("dontUseCache"):
+            result = cache.get(key)
+            if result is not None:
+                return result
+        result = fetch()
+        if isinstance(result, dict) and result.get("status") == "success":
+            cache.set(key, result)
+        return result
+
+    def _execute_generic(self, node_data: dict, node_type: str) -> dict:
+        """Execute a node described by _NODE_SPECS - supports {{variable}} interpolation"""
+        spec = _NODE_SPECS[node_type]
+        kwargs = self._extract(node_data, spec["fields"])
+        self.log(spec["log"].format(**kwargs))
+        call = partial(self._call_client, spec["client"], kwargs, node_data)
+        if "cache" in spec:
+            key = tuple(kwargs.values())
+            result = self._cached_call(self._CACHES[spec["cache"]], key, node_data, call)
+        else:
+            result = call()
+        if spec.get("checked"):
+            return self._finish(spec["result"], result, node_data)
+        self.log(spec["result"].format(result=result))
         self.store_output(node_data, result)
         return result
 
-    def execute_smart_order(self, node_data: dict) -> dict:
-        """Execute Smart Order node - supports {{variable}} interpolation"""
-        symbol = self.get_str(node_data, "symbol", "")
-        exchange = self.get_str(node_data, "exchange", "NSE")
-        action = self.get_str(node_data, "action", "BUY")
-        quantity = self.get_int(node_data, "quantity", 1)
-        position_size = self.get_int(node_data, "positionSize", 0)
-        price_type = self.get_str(node_data, "priceType", "MARKET")
-        product = self.get_str(node_data, "product", "MIS")
-        price = self.get_float(node_data, "price", 0)
-        trigger_price = self.get_float(node_data, "triggerPrice", 0)
+    def _call_client(
+        self, method: str, kwargs: Dict[str, Any], node_data: Optional[dict] = None
+    ) -> Any:
+        """Call an SDK method, using the response prefetched for this node
 
-        self.log(f"Placing smart order: {symbol} {action}")
-        result = self.client.place_smart_order(
-            symbol=symbol,
-            exchange=exchange,
-            action=action,
-            quantity=quantity,
-            position_size=position_size,
-            price_type=price_type,
-            product=product,
-            price=price,
-            trigger_price=trigger_price,
+        A prefetched response is only used by the node it was fetched for
+        (node_data) and only for the same arguments. Responses of
+        _RUN_MEMO_METHODS are reused for identical arguments within the run.
+        """
+        key = (method, tuple(kwargs.items()))
+        result = self._run_memo.get(key)
+        if result is not None:
+            return result
+        result = None
+        if node_data is not None:
+            prefetched = self._prefetched.pop(id(node_data), None)
+            if prefetched is not None and prefetched[0] == key:
+                result = prefetched[1]
+        if result is None:
+            result = getattr(self.client, method)(**kwargs)
+        if method in _RUN_MEMO_METHODS and result is not None and (
+            not isinstance(result, dict) or result.get("status") == "success"
+        ):
+            self._run_memo[key] = result
+        return result
+
+    @staticmethod
+    def can_prefetch(node: dict) -> bool:
+        """Whether a node is a lookup whose call can be made ahead of time
+
+        Its fields must not use {{variables}}, which could still change.
+        """
+        if node.get("type") not in _PREFETCH_CALLS:
+            return False
+        return not any(
+            isinstance(value, str) and "{{" in value
+            for value in node.get("data", {}).values()
         )
-        self.log(
-            f"Smart order result: {result}",
-            "info" if result.get("status") == "success" else "error",
+
+    async def prefetch_lookups(self, nodes: List[dict]):
+        """Make the SDK calls of upcoming lookup nodes concurrently
+
+        The responses are handed to the nodes (via _call_client) when they
+        run, so a run of independent lookups costs one round trip instead of
+        one each. Each response is kept for its own node only.
+        """
+        calls: Dict[Tuple[str, Tuple], partial] = {}
+        node_keys: List[Tuple[dict, Tuple[str, Tuple]]] = []
+        for node in nodes:
+            node_data = node.get("data", {})
+            method, fields = _PREFETCH_CALLS[node["type"]]
+            kwargs = self._extract(node_data, fields)
+            cache = _NODE_SPECS.get(node["type"], {}).get("cache")
+            if (
+                cache
+                and not node_data.get("dontUseCache")
+                and self._CACHES[cache].get(tuple(kwargs.values())) is not None
+            ):
+                continue
+            key = (method, tuple(kwargs.items()))
+            if key in self._run_memo:
+                continue
+            node_keys.append((node_data, key))
+            if key not in calls:
+                calls[key] = partial(getattr(self.client, method), **kwargs)
+        if len(calls) < 2:
+            return
+
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(_node_pool, call) for call in calls.values()),
+            return_exceptions=True,
         )
-        self.store_output(node_data, result)
-        return result
+        # Failed calls are simply made again by their node
+        fetched = {
+            key: result for key, result in zip(calls, results)
+            if not isinstance(result, BaseException)
+        }
+        for node_data, key in node_keys:
+            if key in fetched:
+                self._prefetched[id(node_data)] = (key, fetched[key])
+        self.log(f"Prefetched {len(calls)} lookups in parallel")
+
+    def prefetch_quotes(self, nodes: List[dict]):
+        """Fetch quotes for the quote-reading nodes among siblings in one call"""
+        pairs = [
+            (
+                self.get_str(node.get("data", {}), "symbol", ""),
+                self.get_str(node.get("data", {}), "exchange", "NSE"),
+            )
+            for node in nodes
+            if node.get("type") in QuoteBatcher.NODE_TYPES
+        ]
+        fetched = self.quotes.prefetch(pairs)
+        if fetched:
+            self.log(f"Fetched quotes for {fetched} symbols in one request")
 
     def execute_options_order(self, node_data: dict) -> dict:
         """Execute Options Order node - supports {{variable}} interpolation"""
         underlying = self.get_str(node_data, "underlying", "NIFTY")
         expiry_type = self.get_str(node_data, "expiryType", "current_week")
         quantity = self.get_int(node_data, "quantity", 1)
-        offset = self.get_str(node_data, "offset", "ATM")
-        option_type = self.get_str(node_data, "optionType", "CE")
-        action = self.get_str(node_data, "action", "BUY")
-        price_type = self.get_str(node_data, "priceType", "MARKET")
-        product = self.get_str(node_data, "product", "NRML")
-        split_size = self.get_int(node_data, "splitSize", 0)
+        order_args = self._extract(node_data, _ARG_SCHEMA["optionsOrder"])
 
-        self.log(f"Placing options order: {underlying} {option_type} {offset}")
+        self.log(f"Placing options order: {underlying} {order_args['option_type']} {order_args['offset']}")
 
         # Get the underlying exchange for index
-        if underlying in ["SENSEX", "BANKEX", "SENSEX50"]:
+        if underlying in _BSE_UNDERLYINGS:
             underlying_exchange = "BSE_INDEX"
             fo_exchange = "BFO"
         else:
@@ -314,12 +1155,7 @@ class NodeExecutor:
             fo_exchange = "NFO"
 
         # Get lot size
-        lot_sizes = {
-            "NIFTY": 75, "BANKNIFTY": 30, "FINNIFTY": 65,
-            "MIDCPNIFTY": 120, "NIFTYNXT50": 25,
-            "SENSEX": 20, "BANKEX": 30, "SENSEX50": 25
-        }
-        lot_size = lot_sizes.get(underlying, 75)
+        lot_size = _LOT_SIZES.get(underlying, 75)
         total_quantity = quantity * lot_size
 
         # Resolve expiry date from expiry type
@@ -333,20 +1169,10 @@ class NodeExecutor:
             underlying=underlying,
             exchange=underlying_exchange,
             expiry_date=expiry_date,
-            offset=offset,
-            option_type=option_type,
-            action=action,
             quantity=total_quantity,
-            price_type=price_type,
-            product=product,
-            splitsize=split_size,
-        )
-        self.log(
-            f"Options order result: {result}",
-            "info" if result.get("status") == "success" else "error",
+            **order_args,
         )
-        self.store_output(node_data, result)
-        return result
+        return self._finish("Options order result", result, node_data)
 
     def execute_options_multi_order(self, node_data: dict) -> dict:
         """Execute Multi-Leg Options Order node - supports {{variable}} interpolation
@@ -367,19 +1193,14 @@ class NodeExecutor:
 
         # Get the underlying exchange for index
         underlying_exchange = "NSE_INDEX"
-        if underlying in ["SENSEX", "BANKEX", "SENSEX50"]:
+        if underlying in _BSE_UNDERLYINGS:
             underlying_exchange = "BSE_INDEX"
             fo_exchange = "BFO"
         else:
             fo_exchange = "NFO"
 
         # Get lot size
-        lot_sizes = {
-            "NIFTY": 75, "BANKNIFTY": 30, "FINNIFTY": 65,
-            "MIDCPNIFTY": 120, "NIFTYNXT50": 25,
-            "SENSEX": 20, "BANKEX": 30, "SENSEX50": 25
-        }
-        lot_size = lot_sizes.get(underlying, 75)
+        lot_size = _LOT_SIZES.get(underlying, 75)
         total_quantity = quantity * lot_size
 
         # Resolve expiry date from expiry type
@@ -394,7 +1215,7 @@ class NodeExecutor:
         if not legs:
             return {"status": "error", "message": f"Unknown strategy: {strategy}"}
 
-        self.log(f"Strategy legs: {json.dumps(legs, indent=2)}")
+        self.log(f"Strategy legs: {json.dumps(legs, separators=(',', ':'))}")
 
         # expiry_date, product, pricetype are now included in each leg
         result = self.client.options_multi_order(
@@ -402,53 +1223,84 @@ class NodeExecutor:
             exchange=underlying_exchange,
             legs=legs,
         )
-        self.log(
-            f"Multi-leg order result: {result}",
-            "info" if result.get("status") == "success" else "error",
+        return self._finish("Multi-leg order result", result, node_data)
+
+    def _get_sorted_expiries(self, symbol: str, exchange: str) -> Optional[List[Tuple[str, datetime]]]:
+        """Fetch option expiries as (raw, parsed) pairs sorted by date
+
+        Cached per (symbol, exchange) for the lifetime of this executor, so
+        several option nodes on the same underlying share one get_expiry call.
+        """
+        key = (symbol, exchange)
+        cached = self._expiry_cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = self._call_client(
+            "get_expiry", {"symbol": symbol, "exchange": exchange, "instrumenttype": "options"}
         )
-        self.store_output(node_data, result)
-        return result
+        if response.get("status") != "success":
+            self.log(f"Failed to fetch expiry: {response}", "error")
+            return None
 
-    def _resolve_expiry_date(self, symbol: str, exchange: str, expiry_type: str) -> Optional[str]:
-        """Resolve expiry type to actual expiry date"""
-        try:
-            response = self.client.get_expiry(symbol=symbol, exchange=exchange, instrumenttype="options")
-            if response.get("status") != "success":
-                self.log(f"Failed to fetch expiry: {response}", "error")
-                return None
+        expiry_list = response.get("data", [])
+        if not expiry_list:
+            self.log(f"No expiry dates found for {symbol} on {exchange}", "error")
+            return None
 
-            expiry_list = response.get("data", [])
-            if not expiry_list:
-                self.log(f"No expiry dates found for {symbol} on {exchange}", "error")
+        # Parse and sort expiry dates, filtering out unparseable ones
+        def parse_expiry(exp_str: str) -> Optional[datetime]:
+            """Parse expiry date string, returns None on failure"""
+            if not exp_str or not isinstance(exp_str, str):
                 return None
-
-            # Parse and sort expiry dates, filtering out unparseable ones
-            def parse_expiry(exp_str: str) -> Optional[datetime]:
-                """Parse expiry date string, returns None on failure"""
-                if not exp_str or not isinstance(exp_str, str):
-                    return None
-                # Format: "10-JUL-25" or "25DEC25"
-                for fmt in ["%d-%b-%y", "%d%b%y"]:
+            # Format: "10-JUL-25" or "25DEC25"
+            match = _EXPIRY_RE.match(exp_str.strip())
+            if match:
+                day, month, year = match.groups()
+                month_num = _MONTHS.get(month.upper())
+                if month_num:
                     try:
-                        return datetime.strptime(exp_str.upper(), fmt)
+                        return datetime(2000 + int(year), month_num, int(day))
                     except ValueError:
-                        continue
-                self.log(f"Warning: Could not parse expiry date '{exp_str}'", "warning")
-                return None
+                        pass
+            self.log(f"Warning: Could not parse expiry date '{exp_str}'", "warning")
+            return None
+
+        # Filter and sort expiries, removing unparseable ones
+        valid_expiries = []
+        for exp_str in expiry_list:
+            parsed = parse_expiry(exp_str)
+            if parsed is not None:
+                valid_expiries.append((exp_str, parsed))
 
-            # Filter and sort expiries, removing unparseable ones
-            valid_expiries = []
-            for exp_str in expiry_list:
-                parsed = parse_expiry(exp_str)
-                if parsed is not None:
-                    valid_expiries.append((exp_str, parsed))
+        if not valid_expiries:
+            self.log(f"No valid expiry dates found for {symbol}", "error")
+            return None
+
+        # Sort by parsed date
+        valid_expiries.sort(key=lambda x: x[1])
+        self._expiry_cache[key] = valid_expiries
+        return valid_expiries
 
+    def _resolve_expiry_date(self, symbol: str, exchange: str, expiry_type: str) -> Optional[str]:
+        """Resolve expiry type to actual expiry date"""
+        key = (symbol, exchange, expiry_type)
+        resolved = self._resolved_expiry_cache.get(key)
+        if resolved is not None:
+            return resolved
+
+        resolved = self._resolve_expiry_uncached(symbol, exchange, expiry_type)
+        if resolved is not None:
+            self._resolved_expiry_cache[key] = resolved
+        return resolved
+
+    def _resolve_expiry_uncached(self, symbol: str, exchange: str, expiry_type: str) -> Optional[str]:
+        """Pick the expiry matching expiry_type from the sorted expiry list"""
+        try:
+            valid_expiries = self._get_sorted_expiries(symbol, exchange)
             if not valid_expiries:
-                self.log(f"No valid expiry dates found for {symbol}", "error")
                 return None
 
-            # Sort by parsed date
-            valid_expiries.sort(key=lambda x: x[1])
             sorted_expiries = [exp[0] for exp in valid_expiries]
             now = datetime.now()
             current_month = now.month
@@ -476,10 +1328,7 @@ class NodeExecutor:
 
             elif expiry_type == "current_month":
                 # Last expiry of current calendar month
-                result = None
-                for exp_str, exp_date in valid_expiries:
-                    if exp_date.month == current_month and exp_date.year == current_year:
-                        result = exp_str  # Keep updating to get the last one
+                result = _last_expiry_in_month(valid_expiries, current_year, current_month)
                 if result:
                     return self._format_expiry_for_api(result)
                 self.log(f"No current month expiry found for {symbol}", "error")
@@ -487,10 +1336,7 @@ class NodeExecutor:
 
             elif expiry_type == "next_month":
                 # Last expiry of next calendar month
-                result = None
-                for exp_str, exp_date in valid_expiries:
-                    if exp_date.month == next_month and exp_date.year == next_year:
-                        result = exp_str
+                result = _last_expiry_in_month(valid_expiries, next_year, next_month)
                 if result:
                     return self._format_expiry_for_api(result)
                 self.log(f"No next month expiry found for {symbol}", "error")
@@ -522,98 +1368,24 @@ class NodeExecutor:
 
         Each leg includes: offset, option_type, action, quantity, expiry_date, product, pricetype
         """
-        buy_action = "BUY"
-        sell_action = "SELL"
+        # Iron strategies flip every leg for a BUY; everything else is fixed
+        if strategy in _ACTION_VARIANT_STRATEGIES:
+            strategy = f"{strategy}_{'SELL' if action == 'SELL' else 'BUY'}"
+        template = _STRATEGY_TEMPLATES.get(strategy, ())
 
-        def make_leg(offset: str, option_type: str, leg_action: str) -> Dict[str, Any]:
-            return {
+        return [
+            {
                 "offset": offset,
                 "option_type": option_type,
-                "action": leg_action,
+                "action": action if leg_action == "action" else leg_action,
                 "quantity": quantity,
                 "expiry_date": expiry_date,
                 "product": product,
                 "pricetype": pricetype,
                 "splitsize": 0
             }
-
-        if strategy == "straddle":
-            # ATM CE + ATM PE (same action)
-            return [
-                make_leg("ATM", "CE", action),
-                make_leg("ATM", "PE", action),
-            ]
-
-        elif strategy == "strangle":
-            # OTM CE + OTM PE (same action)
-            return [
-                make_leg("OTM2", "CE", action),
-                make_leg("OTM2", "PE", action),
-            ]
-
-        elif strategy == "iron_condor":
-            # Sell OTM CE + Sell OTM PE + Buy further OTM CE + Buy further OTM PE
-            if action == "SELL":
-                return [
-                    make_leg("OTM5", "CE", sell_action),
-                    make_leg("OTM5", "PE", sell_action),
-                    make_leg("OTM10", "CE", buy_action),
-                    make_leg("OTM10", "PE", buy_action),
-                ]
-            else:
-                return [
-                    make_leg("OTM5", "CE", buy_action),
-                    make_leg("OTM5", "PE", buy_action),
-                    make_leg("OTM10", "CE", sell_action),
-                    make_leg("OTM10", "PE", sell_action),
-                ]
-
-        elif strategy == "iron_butterfly":
-            # Sell ATM CE + Sell ATM PE + Buy OTM CE + Buy OTM PE
-            if action == "SELL":
-                return [
-                    make_leg("ATM", "CE", sell_action),
-                    make_leg("ATM", "PE", sell_action),
-                    make_leg("OTM3", "CE", buy_action),
-                    make_leg("OTM3", "PE", buy_action),
-                ]
-            else:
-                return [
-                    make_leg("ATM", "CE", buy_action),
-                    make_leg("ATM", "PE", buy_action),
-                    make_leg("OTM3", "CE", sell_action),
-                    make_leg("OTM3", "PE", sell_action),
-                ]
-
-        elif strategy == "bull_call_spread":
-            # Buy lower strike CE + Sell higher strike CE
-            return [
-                make_leg("ATM", "CE", buy_action),
-                make_leg("OTM3", "CE", sell_action),
-            ]
-
-        elif strategy == "bear_put_spread":
-            # Buy higher strike PE + Sell lower strike PE
-            return [
-                make_leg("ATM", "PE", buy_action),
-                make_leg("OTM3", "PE", sell_action),
-            ]
-
-        elif strategy == "bull_put_spread":
-            # Sell higher strike PE + Buy lower strike PE
-            return [
-                make_leg("ATM", "PE", sell_action),
-                make_leg("OTM3", "PE", buy_action),
-            ]
-
-        elif strategy == "bear_call_spread":
-            # Sell lower strike CE + Buy higher strike CE
-            return [
-                make_leg("ATM", "CE", sell_action),
-                make_leg("OTM3", "CE", buy_action),
-            ]
-
-        return []
+            for offset, option_type, leg_action in template
+        ]
 
     def execute_basket_order(self, node_data: dict) -> dict:
         """Execute Basket Order node - parses CSV-like orders string"""
@@ -654,91 +1426,33 @@ class NodeExecutor:
 
         self.log(f"Placing basket order with {len(orders)} orders")
         result = self.client.basket_order(orders=orders)
-        self.log(
-            f"Basket order result: {result}",
-            "info" if result.get("status") == "success" else "error",
-        )
-        self.store_output(node_data, result)
-        return result
-
-    def execute_split_order(self, node_data: dict) -> dict:
-        """Execute Split Order node - supports {{variable}} interpolation"""
-        symbol = self.get_str(node_data, "symbol", "")
-        exchange = self.get_str(node_data, "exchange", "NSE")
-        action = self.get_str(node_data, "action", "BUY")
-        quantity = self.get_int(node_data, "quantity", 1)
-        split_size = self.get_int(node_data, "splitSize", 10)
-        price_type = self.get_str(node_data, "priceType", "MARKET")
-        product = self.get_str(node_data, "product", "MIS")
-
-        self.log(f"Placing split order: {symbol} qty={quantity} split={split_size}")
-        result = self.client.split_order(
-            symbol=symbol,
-            exchange=exchange,
-            action=action,
-            quantity=quantity,
-            splitsize=split_size,
-            price_type=price_type,
-            product=product,
-        )
-        self.log(
-            f"Split order result: {result}",
-            "info" if result.get("status") == "success" else "error",
-        )
-        self.store_output(node_data, result)
-        return result
+        return self._finish("Basket order result", result, node_data)
 
     def execute_modify_order(self, node_data: dict) -> dict:
-        """Execute Modify Order node"""
-        order_id = self.context.interpolate(str(node_data.get("orderId", "")))
-        self.log(f"Modifying order: {order_id}")
-        result = self.client.modify_order(
-            order_id=order_id,
-            symbol=node_data.get("symbol", ""),
-            exchange=node_data.get("exchange", "NSE"),
-            action=node_data.get("action", "BUY"),
-            quantity=int(node_data.get("quantity", 1)),
-            price_type=node_data.get("priceType", "LIMIT"),
-            product=node_data.get("product", "MIS"),
-            price=float(node_data.get("price", 0)),
-            trigger_price=float(node_data.get("triggerPrice", 0)),
-        )
-        self.log(
-            f"Modify order result: {result}",
-            "info" if result.get("status") == "success" else "error",
-        )
-        return result
+        """Execute Modify Order node - supports {{variable}} interpolation"""
+        args = self._extract(node_data, _ARG_SCHEMA["modifyOrder"])
+        self.log(f"Modifying order: {args['order_id']}")
+        result = self.client.modify_order(**args)
+        return self._finish("Modify order result", result)
 
     def execute_cancel_order(self, node_data: dict) -> dict:
         """Execute Cancel Order node"""
-        order_id = self.context.interpolate(str(node_data.get("orderId", "")))
+        order_id = self.get_str(node_data, "orderId", "")
         self.log(f"Cancelling order: {order_id}")
         result = self.client.cancel_order(order_id=order_id)
-        self.log(
-            f"Cancel order result: {result}",
-            "info" if result.get("status") == "success" else "error",
-        )
-        return result
+        return self._finish("Cancel order result", result)
 
     def execute_cancel_all_orders(self, node_data: dict) -> dict:
         """Execute Cancel All Orders node"""
         self.log("Cancelling all orders")
         result = self.client.cancel_all_orders()
-        self.log(
-            f"Cancel all result: {result}",
-            "info" if result.get("status") == "success" else "error",
-        )
-        return result
+        return self._finish("Cancel all result", result)
 
     def execute_close_positions(self, node_data: dict) -> dict:
         """Execute Close Positions node"""
         self.log("Closing all positions")
         result = self.client.close_position()
-        self.log(
-            f"Close positions result: {result}",
-            "info" if result.get("status") == "success" else "error",
-        )
-        return result
+        return self._finish("Close positions result", result)
 
     def execute_get_quote(self, node_data: dict) -> dict:
         """Execute Get Quote node - supports {{variable}} interpolation"""
@@ -759,103 +1473,36 @@ class NodeExecutor:
         self.store_output(node_data, result)
         return result
 
-    def execute_get_depth(self, node_data: dict) -> dict:
-        """Execute Get Depth node - supports {{variable}} interpolation"""
-        symbol = self.get_str(node_data, "symbol", "")
-        exchange = self.get_str(node_data, "exchange", "NSE")
-        self.log(f"Getting depth for: {symbol} ({exchange})")
-        result = self.client.get_depth(symbol=symbol, exchange=exchange)
-        self.log(f"Depth result received")
-        self.store_output(node_data, result)
-        return result
-
     def execute_get_order_status(self, node_data: dict) -> dict:
         """Execute Get Order Status node"""
-        order_id = self.context.interpolate(str(node_data.get("orderId", "")))
+        order_id = self.get_str(node_data, "orderId", "")
         self.log(f"Getting order status for: {order_id}")
         result = self.client.get_order_status(order_id=order_id)
         self.log(f"Order status result: {result}")
         self.store_output(node_data, result)
         return result
 
-    def execute_open_position(self, node_data: dict) -> dict:
-        """Execute Open Position node - supports {{variable}} interpolation"""
-        symbol = self.get_str(node_data, "symbol", "")
-        exchange = self.get_str(node_data, "exchange", "NSE")
-        product = self.get_str(node_data, "product", "MIS")
-        self.log(f"Getting open position for: {symbol}")
-        result = self.client.get_open_position(
-            symbol=symbol, exchange=exchange, product=product
-        )
-        self.log(f"Open position result: {result}")
-        self.store_output(node_data, result)
-        return result
-
     def execute_history(self, node_data: dict) -> dict:
         """Execute History node - supports {{variable}} interpolation"""
-        symbol = self.get_str(node_data, "symbol", "")
-        exchange = self.get_str(node_data, "exchange", "NSE")
-        interval = self.get_str(node_data, "interval", "5m")
-        start_date = self.get_str(node_data, "startDate", "")
-        end_date = self.get_str(node_data, "endDate", "")
-        self.log(f"Getting history for: {symbol} ({interval})")
-        result = self.client.get_history(
-            symbol=symbol,
-            exchange=exchange,
-            interval=interval,
-            start_date=start_date,
-            end_date=end_date,
-        )
+        args = self._extract(node_data, _ARG_SCHEMA["history"])
+        self.log(f"Getting history for: {args['symbol']} ({args['interval']})")
+        result = self._call_client("get_history", args, node_data)
         self.log(f"History data received")
-        self.store_output(node_data, {"status": "success", "data": str(result)})
-        return {"status": "success", "data": result}
-
-    def execute_expiry(self, node_data: dict) -> dict:
-        """Execute Expiry node - supports {{variable}} interpolation"""
-        symbol = self.get_str(node_data, "symbol", "NIFTY")
-        exchange = self.get_str(node_data, "exchange", "NFO")
-        instrument_type = self.get_str(node_data, "instrumentType", "options")
-        self.log(f"Getting expiry dates for: {symbol}")
-        result = self.client.get_expiry(
-            symbol=symbol, exchange=exchange, instrumenttype=instrument_type
-        )
-        self.log(f"Expiry result: {result}")
-        self.store_output(node_data, result)
-        return result
-
-    def execute_symbol(self, node_data: dict) -> dict:
-        """Execute Symbol node - get symbol info (lotsize, tick_size, etc.)"""
-        symbol = self.get_str(node_data, "symbol", "")
-        exchange = self.get_str(node_data, "exchange", "NSE")
-        self.log(f"Getting symbol info for: {symbol} ({exchange})")
-        result = self.client.symbol(symbol=symbol, exchange=exchange)
-        self.log(f"Symbol result: {result}")
-        self.store_output(node_data, result)
-        return result
-
-    def execute_option_symbol(self, node_data: dict) -> dict:
-        """Execute OptionSymbol node - resolve option symbol from underlying"""
-        underlying = self.get_str(node_data, "underlying", "NIFTY")
-        exchange = self.get_str(node_data, "exchange", "NSE_INDEX")
-        expiry_date = self.get_str(node_data, "expiryDate", "")
-        offset = self.get_str(node_data, "offset", "ATM")
-        option_type = self.get_str(node_data, "optionType", "CE")
-        self.log(f"Resolving option symbol: {underlying} {option_type} {offset}")
-        result = self.client.optionsymbol(
-            underlying=underlying,
-            exchange=exchange,
-            expiry_date=expiry_date,
-            offset=offset,
-            option_type=option_type
-        )
-        self.log(f"Option symbol result: {result}")
-        self.store_output(node_data, result)
-        return result
+        if hasattr(result, "to_dict"):
+            # The SDK returns a DataFrame; store plain records (timestamps as
+            # ISO strings) so Variable and Log nodes can serialize them
+            frame = result.reset_index()
+            for column in frame.select_dtypes(include=["datetime", "datetimetz"]).columns:
+                frame[column] = frame[column].map(lambda ts: ts.isoformat())
+            result = frame.to_dict("records")
+        output = {"status": "success", "data": result}
+        self.store_output(node_data, output)
+        return output
 
     def execute_order_book(self, node_data: dict) -> dict:
         """Execute OrderBook node - get all orders for the day"""
         self.log("Fetching order book")
-        result = self.client.orderbook()
+        result = self._call_client("orderbook", {}, node_data)
         self.log(f"Order book: {len(result.get('data', []))} orders")
         self.store_output(node_data, result)
         return result
@@ -863,7 +1510,7 @@ class NodeExecutor:
     def execute_trade_book(self, node_data: dict) -> dict:
         """Execute TradeBook node - get all trades for the day"""
         self.log("Fetching trade book")
-        result = self.client.tradebook()
+        result = self._call_client("tradebook", {}, node_data)
         self.log(f"Trade book: {len(result.get('data', []))} trades")
         self.store_output(node_data, result)
         return result
@@ -871,48 +1518,18 @@ class NodeExecutor:
     def execute_position_book(self, node_data: dict) -> dict:
         """Execute PositionBook node - get all positions"""
         self.log("Fetching position book")
-        result = self.client.positionbook()
+        result = self._call_client("positionbook", {}, node_data)
         self.log(f"Position book: {len(result.get('data', []))} positions")
         self.store_output(node_data, result)
         return result
 
-    def execute_synthetic_future(self, node_data: dict) -> dict:
-        """Execute SyntheticFuture node - calculate synthetic future price"""
-        underlying = self.get_str(node_data, "underlying", "NIFTY")
-        exchange = self.get_str(node_data, "exchange", "NSE_INDEX")
-        expiry_date = self.get_str(node_data, "expiryDate", "")
-        self.log(f"Calculating synthetic future for: {underlying}")
-        result = self.client.syntheticfuture(
-            underlying=underlying,
-            exchange=exchange,
-            expiry_date=expiry_date
-        )
-        self.log(f"Synthetic future result: {result}")
-        self.store_output(node_data, result)
-        return result
-
-    def execute_option_chain(self, node_data: dict) -> dict:
-        """Execute OptionChain node - get option chain data"""
-        underlying = self.get_str(node_data, "underlying", "NIFTY")
-        exchange = self.get_str(node_data, "exchange", "NSE_INDEX")
-        expiry_date = self.get_str(node_data, "expiryDate", "")
-        strike_count = self.get_int(node_data, "strikeCount", 10)
-        self.log(f"Fetching option chain for: {underlying} expiry={expiry_date}")
-        result = self.client.optionchain(
-            underlying=underlying,
-            exchange=exchange,
-            expiry_date=expiry_date,
-            strike_count=strike_count
-        )
-        self.log(f"Option chain result received")
-        self.store_output(node_data, result)
-        return result
-
     def execute_holidays(self, node_data: dict) -> dict:
         """Execute Holidays node - get market holidays for a year"""
         year = self.get_str(node_data, "year", str(datetime.now().year))
         self.log(f"Fetching holidays for year: {year}")
-        result = self.client.holidays(year=year)
+        result = self._cached_call(
+            _HOLIDAYS_CACHE, year, node_data, partial(self.client.holidays, year=year)
+        )
         self.log(f"Holidays: {len(result.get('data', []))} holidays")
         self.store_output(node_data, result)
         return result
@@ -921,7 +1538,9 @@ class NodeExecutor:
         """Execute Timings node - get market timings for a date"""
         date = self.get_str(node_data, "date", datetime.now().strftime("%Y-%m-%d"))
         self.log(f"Fetching market timings for: {date}")
-        result = self.client.timings(date=date)
+        result = self._cached_call(
+            _TIMINGS_CACHE, date, node_data, partial(self.client.timings, date=date)
+        )
         self.log(f"Timings result: {result}")
         self.store_output(node_data, result)
         return result
@@ -948,33 +1567,18 @@ class NodeExecutor:
                 if not self.client.ws_connect():
                     raise Exception("Failed to connect to WebSocket server")
 
-            # Create event to wait for first data
-            data_received = threading.Event()
-            received_data = {"ltp": 0, "data": {}}
-
-            def on_ltp_callback(data):
-                # SDK callback receives data dict with exchange, symbol, ltp
-                sym = data.get("symbol", "")
-                exch = data.get("exchange", "")
-                if sym == symbol and exch == exchange:
-                    received_data["ltp"] = data.get("ltp", 0)
-                    received_data["data"] = data
-                    data_received.set()
-
-            # Subscribe using SDK WebSocket
-            instruments = [{"exchange": exchange, "symbol": symbol}]
-            self.client.ws_subscribe_ltp(instruments, on_ltp_callback)
-
-            # Wait for first data with timeout (5 seconds)
-            if data_received.wait(timeout=5.0):
-                ltp = received_data["ltp"]
+            # Subscribe (batched with concurrent subscribes) and wait for
+            # first data with timeout (5 seconds)
+            data = self.client.ws_first_tick("ltp", exchange, symbol, timeout=5.0)
+            if data is not None:
+                ltp = data.get("ltp", 0)
                 result = {
                     "status": "success",
                     "type": "ltp",
                     "symbol": symbol,
                     "exchange": exchange,
                     "ltp": ltp,
-                    "data": received_data.get("data", {})
+                    "data": data
                 }
                 self.context.set_variable(output_var, ltp)
                 self.log(f"LTP for {symbol}: {ltp} (via WebSocket)")
@@ -1025,25 +1629,10 @@ class NodeExecutor:
                 if not self.client.ws_connect():
                     raise Exception("Failed to connect to WebSocket server")
 
-            # Create event to wait for first data
-            data_received = threading.Event()
-            received_data = {"data": {}}
-
-            def on_quote_callback(data):
-                # SDK callback receives quote data with OHLC
-                sym = data.get("symbol", "")
-                exch = data.get("exchange", "")
-                if sym == symbol and exch == exchange:
-                    received_data["data"] = data
-                    data_received.set()
-
-            # Subscribe using SDK WebSocket
-            instruments = [{"exchange": exchange, "symbol": symbol}]
-            self.client.ws_subscribe_quote(instruments, on_quote_callback)
-
-            # Wait for first data with timeout (5 seconds)
-            if data_received.wait(timeout=5.0):
-                data = received_data["data"]
+            # Subscribe (batched with concurrent subscribes) and wait for
+            # first data with timeout (5 seconds)
+            data = self.client.ws_first_tick("quote", exchange, symbol, timeout=5.0)
+            if data is not None:
                 result = {
                     "status": "success",
                     "type": "quote",
@@ -1115,25 +1704,10 @@ class NodeExecutor:
                 if not self.client.ws_connect():
                     raise Exception("Failed to connect to WebSocket server")
 
-            # Create event to wait for first data
-            data_received = threading.Event()
-            received_data = {"data": {}}
-
-            def on_depth_callback(data):
-                # SDK callback receives depth data with bids/asks
-                sym = data.get("symbol", "")
-                exch = data.get("exchange", "")
-                if sym == symbol and exch == exchange:
-                    received_data["data"] = data
-                    data_received.set()
-
-            # Subscribe using SDK WebSocket
-            instruments = [{"exchange": exchange, "symbol": symbol}]
-            self.client.ws_subscribe_depth(instruments, on_depth_callback)
-
-            # Wait for first data with timeout (5 seconds)
-            if data_received.wait(timeout=5.0):
-                data = received_data["data"]
+            # Subscribe (batched with concurrent subscribes) and wait for
+            # first data with timeout (5 seconds)
+            data = self.client.ws_first_tick("depth", exchange, symbol, timeout=5.0)
+            if data is not None:
                 result = {
                     "status": "success",
                     "type": "depth",
@@ -1194,7 +1768,7 @@ class NodeExecutor:
 
         try:
             if self.client.ws_is_connected():
-                instruments = [{"exchange": exchange, "symbol": symbol}] if symbol else []
+                instruments = [ws_instrument(exchange, symbol)] if symbol else []
 
                 if stream_type == "ltp" or stream_type == "all":
                     if instruments:
@@ -1246,7 +1820,7 @@ class NodeExecutor:
     def execute_holdings(self, node_data: dict) -> dict:
         """Execute Holdings node - get portfolio holdings"""
         self.log("Fetching portfolio holdings")
-        result = self.client.holdings()
+        result = self._call_client("holdings", {}, node_data)
         holdings_count = len(result.get("data", {}).get("holdings", []))
         self.log(f"Holdings: {holdings_count} holdings")
         self.store_output(node_data, result)
@@ -1255,7 +1829,7 @@ class NodeExecutor:
     def execute_funds(self, node_data: dict) -> dict:
         """Execute Funds node - get account funds"""
         self.log("Fetching account funds")
-        result = self.client.funds()
+        result = self._call_client("funds", {}, node_data)
         available = result.get("data", {}).get("availablecash", "0")
         self.log(f"Available cash: {available}")
         self.store_output(node_data, result)
@@ -1277,11 +1851,7 @@ class NodeExecutor:
         message = self.context.interpolate(node_data.get("message", ""))
         self.log(f"Sending Telegram alert to {username}: {message}")
         result = self.client.send_telegram(username=username, message=message)
-        self.log(
-            f"Telegram result: {result}",
-            "info" if result.get("status") == "success" else "error",
-        )
-        return result
+        return self._finish("Telegram result", result)
 
     def execute_http_request(self, node_data: dict) -> dict:
         """Execute HTTP Request node - make external API calls
@@ -1289,8 +1859,6 @@ class NodeExecutor:
         Supports GET, POST, PUT, DELETE, PATCH methods with custom headers and body.
         Response is stored in output variable for use in subsequent nodes.
         """
-        import requests
-
         method = self.get_str(node_data, "method", "GET").upper()
         url = self.get_str(node_data, "url", "")
         headers_raw = node_data.get("headers", {})
@@ -1310,9 +1878,8 @@ class NodeExecutor:
         elif isinstance(headers_raw, str) and headers_raw:
             # Try to parse as JSON
             try:
-                import json
                 headers = json.loads(headers_raw)
-            except:
+            except ValueError:
                 pass
 
         # Add content type if not present
@@ -1326,50 +1893,39 @@ class NodeExecutor:
 
         self.log(f"HTTP {method} {url}")
 
+        if method not in _HTTP_METHODS:
+            self.log(f"HTTP Request: Unsupported method '{method}'", "error")
+            return {"status": "error", "message": f"Unsupported method: {method}"}
+
+        # Only POST/PUT/PATCH carry a body; JSON bodies are parsed once and
+        # sent as json=, anything else (or unparseable) as raw data=
+        body_json = None
+        body_data = None
+        if method in _HTTP_BODY_METHODS:
+            body_data = body
+            # Only object/array bodies go through json.loads; any other text
+            # reaches the wire unchanged as data= anyway
+            if (
+                content_type == "application/json"
+                and isinstance(body, str)
+                and body.lstrip()[:1] in ("{", "[")
+            ):
+                try:
+                    body_json = json.loads(body)
+                    body_data = None
+                except ValueError:
+                    pass
+
+        session = _get_http_session()
         try:
-            # Make the request based on method
-            if method == "GET":
-                response = requests.get(url, headers=headers, timeout=timeout)
-            elif method == "POST":
-                if content_type == "application/json" and isinstance(body, str):
-                    try:
-                        import json
-                        body = json.loads(body)
-                        response = requests.post(url, json=body, headers=headers, timeout=timeout)
-                    except:
-                        response = requests.post(url, data=body, headers=headers, timeout=timeout)
-                else:
-                    response = requests.post(url, data=body, headers=headers, timeout=timeout)
-            elif method == "PUT":
-                if content_type == "application/json" and isinstance(body, str):
-                    try:
-                        import json
-                        body = json.loads(body)
-                        response = requests.put(url, json=body, headers=headers, timeout=timeout)
-                    except:
-                        response = requests.put(url, data=body, headers=headers, timeout=timeout)
-                else:
-                    response = requests.put(url, data=body, headers=headers, timeout=timeout)
-            elif method == "DELETE":
-                response = requests.delete(url, headers=headers, timeout=timeout)
-            elif method == "PATCH":
-                if content_type == "application/json" and isinstance(body, str):
-                    try:
-                        import json
-                        body = json.loads(body)
-                        response = requests.patch(url, json=body, headers=headers, timeout=timeout)
-                    except:
-                        response = requests.patch(url, data=body, headers=headers, timeout=timeout)
-                else:
-                    response = requests.patch(url, data=body, headers=headers, timeout=timeout)
-            else:
-                self.log(f"HTTP Request: Unsupported method '{method}'", "error")
-                return {"status": "error", "message": f"Unsupported method: {method}"}
+            response = session.request(
+                method, url, headers=headers, json=body_json, data=body_data, timeout=timeout
+            )
 
             # Parse response
             try:
                 response_data = response.json()
-            except:
+            except ValueError:
                 response_data = response.text
 
             result = {
@@ -1391,10 +1947,8 @@ class NodeExecutor:
             self.log(f"HTTP Request failed: {str(e)}", "error")
             return {"status": "error", "message": str(e)}
 
-    def execute_delay(self, node_data: dict) -> dict:
+    async def execute_delay(self, node_data: dict) -> dict:
         """Execute Delay node - supports seconds, minutes, hours"""
-        import time as time_module
-
         # New format: delayValue + delayUnit
         delay_value = node_data.get("delayValue")
         delay_unit = node_data.get("delayUnit", "seconds")
@@ -1418,60 +1972,52 @@ class NodeExecutor:
             display = f"{delay_ms}ms"
 
         self.log(f"Waiting for {display}")
-        time_module.sleep(delay_seconds)
+        # Sleep on the event loop so a long delay never holds a pool worker
+        await asyncio.sleep(delay_seconds)
         self.log(f"Delay complete")
         return {"status": "success", "message": f"Waited {display}"}
 
-    def execute_wait_until(self, node_data: dict) -> dict:
+    async def execute_wait_until(self, node_data: dict) -> dict:
         """Execute Wait Until node - pauses until target time is reached
 
         Used for time-based entry/exit strategies like BuildAlgos.
+        Sleeps once for the remaining time instead of polling the clock.
         """
-        import time as time_module
-
         target_time_str = node_data.get("targetTime", "09:30")
-        check_interval_ms = int(node_data.get("checkIntervalMs", 1000))
 
         # Use safe time parsing
-        target_hour, target_minute, target_second = parse_time_string(target_time_str, 9, 30)
-        target_time = time(target_hour, target_minute, target_second)
+        target_time = parse_time_of_day(target_time_str, 9, 30)
 
-        now = datetime.now().time()
-        now_seconds = now.hour * 3600 + now.minute * 60 + now.second
-        target_seconds = target_time.hour * 3600 + target_time.minute * 60 + target_time.second
+        now = datetime.now()
+        target_dt = datetime.combine(now.date(), target_time)
+        wait_seconds = (target_dt - now).total_seconds()
 
         # If target time has already passed today, continue immediately
-        if now_seconds >= target_seconds:
+        current = now.strftime("%H:%M:%S")
+        if wait_seconds <= 0:
             self.log(
-                f"Wait Until: Target time {target_time_str} has already passed (current: {now.strftime('%H:%M:%S')}), continuing..."
+                f"Wait Until: Target time {target_time_str} has already passed (current: {current}), continuing..."
             )
             return {
                 "status": "success",
                 "message": f"Target time {target_time_str} already passed",
-                "current_time": now.strftime("%H:%M:%S"),
+                "current_time": current,
                 "target_time": target_time_str,
                 "waited": False,
             }
 
-        # Calculate wait duration
-        wait_seconds = target_seconds - now_seconds
         self.log(
-            f"Wait Until: Waiting for {target_time_str} (current: {now.strftime('%H:%M:%S')}, ~{wait_seconds}s remaining)"
+            f"Wait Until: Waiting for {target_time_str} (current: {current}, ~{int(wait_seconds)}s remaining)"
         )
 
-        # Wait in intervals, checking time periodically
-        check_interval_sec = check_interval_ms / 1000
-        while True:
-            now = datetime.now().time()
-            now_seconds = now.hour * 3600 + now.minute * 60 + now.second
-
-            if now_seconds >= target_seconds:
-                break
-
-            # Sleep for the check interval or remaining time, whichever is smaller
-            remaining = target_seconds - now_seconds
-            sleep_time = min(check_interval_sec, remaining)
-            time_module.sleep(sleep_time)
+        await asyncio.sleep(wait_seconds)
+        # The loop timer runs on the monotonic clock and may fire marginally
+        # early (or the wall clock may have been adjusted); top up so the next
+        # node never runs before the target time
+        remaining = (target_dt - datetime.now()).total_seconds()
+        while remaining > 0:
+            await asyncio.sleep(remaining)
+            remaining = (target_dt - datetime.now()).total_seconds()
 
         self.log(f"Wait Until: Target time {target_time_str} reached!")
         return {
@@ -1519,11 +2065,7 @@ class NodeExecutor:
             if operation == "set":
                 # Try to parse as JSON if it looks like JSON
                 if isinstance(var_value, str):
-                    if var_value.startswith("{") or var_value.startswith("["):
-                        try:
-                            var_value = json.loads(var_value)
-                        except json.JSONDecodeError:
-                            pass
+                    var_value = _maybe_json(var_value)
                 self.context.set_variable(var_name, var_value)
                 self.log(f"Set variable {var_name} = {var_value}")
 
@@ -1535,83 +2077,21 @@ class NodeExecutor:
                     self.log(f"Copied {source_var} to {var_name}")
                 return {"status": "success", "variable": var_name, "value": source_value}
 
-            elif operation == "add":
-                current = self.context.get_variable(var_name, 0)
-                try:
-                    current_num = float(current) if current else 0
-                    add_value = float(var_value) if var_value else 0
-                    result = current_num + add_value
-                    self.context.set_variable(var_name, result)
-                    self.log(f"Added {add_value} to {var_name}: {result}")
-                    var_value = result
-                except (ValueError, TypeError) as e:
-                    self.log(f"Add operation failed: {e}", "error")
-                    return {"status": "error", "message": str(e)}
-
-            elif operation == "subtract":
-                current = self.context.get_variable(var_name, 0)
-                try:
-                    current_num = float(current) if current else 0
-                    sub_value = float(var_value) if var_value else 0
-                    result = current_num - sub_value
-                    self.context.set_variable(var_name, result)
-                    self.log(f"Subtracted {sub_value} from {var_name}: {result}")
-                    var_value = result
-                except (ValueError, TypeError) as e:
-                    self.log(f"Subtract operation failed: {e}", "error")
-                    return {"status": "error", "message": str(e)}
-
-            elif operation == "multiply":
-                current = self.context.get_variable(var_name, 0)
-                try:
-                    current_num = float(current) if current else 0
-                    mul_value = float(var_value) if var_value else 1
-                    result = current_num * mul_value
-                    self.context.set_variable(var_name, result)
-                    self.log(f"Multiplied {var_name} by {mul_value}: {result}")
-                    var_value = result
-                except (ValueError, TypeError) as e:
-                    self.log(f"Multiply operation failed: {e}", "error")
-                    return {"status": "error", "message": str(e)}
-
-            elif operation == "divide":
+            elif operation in self._ARITH_OPS:
+                func, default, uses_value, message, label = self._ARITH_OPS[operation]
                 current = self.context.get_variable(var_name, 0)
                 try:
-                    current_num = float(current) if current else 0
-                    div_value = float(var_value) if var_value else 1
-                    if div_value == 0:
+                    current_num = _to_float(current, 0)
+                    operand = _to_float(var_value, default) if uses_value else default
+                    if operation == "divide" and operand == 0:
                         self.log(f"Division by zero error", "error")
                         return {"status": "error", "message": "Division by zero"}
-                    result = current_num / div_value
-                    self.context.set_variable(var_name, result)
-                    self.log(f"Divided {var_name} by {div_value}: {result}")
-                    var_value = result
-                except (ValueError, TypeError) as e:
-                    self.log(f"Divide operation failed: {e}", "error")
-                    return {"status": "error", "message": str(e)}
-
-            elif operation == "increment":
-                current = self.context.get_variable(var_name, 0)
-                try:
-                    current_num = float(current) if current else 0
-                    result = current_num + 1
+                    result = func(current_num, operand)
                     self.context.set_variable(var_name, result)
-                    self.log(f"Incremented {var_name}: {result}")
+                    self.log(message.format(operand=operand, name=var_name, result=result))
                     var_value = result
                 except (ValueError, TypeError) as e:
-                    self.log(f"Increment operation failed: {e}", "error")
-                    return {"status": "error", "message": str(e)}
-
-            elif operation == "decrement":
-                current = self.context.get_variable(var_name, 0)
-                try:
-                    current_num = float(current) if current else 0
-                    result = current_num - 1
-                    self.context.set_variable(var_name, result)
-                    self.log(f"Decremented {var_name}: {result}")
-                    var_value = result
-                except (ValueError, TypeError) as e:
-                    self.log(f"Decrement operation failed: {e}", "error")
+                    self.log(f"{label} operation failed: {e}", "error")
                     return {"status": "error", "message": str(e)}
 
             elif operation == "append":
@@ -1623,11 +2103,11 @@ class NodeExecutor:
 
             elif operation == "parse_json":
                 try:
-                    parsed = json.loads(str(var_value))
+                    parsed = orjson.loads(str(var_value))
                     self.context.set_variable(var_name, parsed)
                     self.log(f"Parsed JSON into {var_name}")
                     var_value = parsed
-                except json.JSONDecodeError as e:
+                except orjson.JSONDecodeError as e:
                     self.log(f"JSON parse failed: {e}", "error")
                     return {"status": "error", "message": f"Invalid JSON: {e}"}
 
@@ -1675,7 +2155,7 @@ class NodeExecutor:
 
             # Step 2: Safely evaluate the expression
             # Only allow safe mathematical operations
-            result = self._safe_eval_math(interpolated)
+            result = self._eval_math_template(expression, interpolated)
 
             # Step 3: Store result in output variable
             self.context.set_variable(output_var, result)
@@ -1693,65 +2173,42 @@ class NodeExecutor:
             self.log(f"Math expression failed: {e}", "error")
             return {"status": "error", "message": str(e)}
 
-    def _safe_eval_math(self, expression: str) -> float:
-        """Safely evaluate a mathematical expression
+    def _eval_math_template(self, expression: str, interpolated: str) -> float:
+        """Evaluate a math template against current variables
 
-        Uses Python's ast module to parse and evaluate only safe math operations.
-        Prevents arbitrary code execution.
+        The template is compiled once with its placeholders bound to numeric
+        variable values. Anything else (missing or non-numeric values, and
+        negative ones, whose text changes how ** binds) goes through the
+        interpolated text so results match plain substitution.
         """
-        import ast
-        import operator as op
-
-        # Supported operators
-        operators = {
-            ast.Add: op.add,
-            ast.Sub: op.sub,
-            ast.Mult: op.mul,
-            ast.Div: op.truediv,
-            ast.Mod: op.mod,
-            ast.Pow: op.pow,
-            ast.USub: op.neg,
-            ast.UAdd: op.pos,
-        }
-
-        def _eval(node):
-            # Handle numeric constants (Python 3.8+)
-            if isinstance(node, ast.Constant):
-                if isinstance(node.value, (int, float)):
-                    return node.value
-                raise ValueError(f"Unsupported constant: {node.value}")
-            # Handle ast.Num for Python 3.7 compatibility (if available)
-            elif hasattr(ast, 'Num') and isinstance(node, ast.Num):
-                return node.n
-            elif isinstance(node, ast.BinOp):
-                left = _eval(node.left)
-                right = _eval(node.right)
-                op_type = type(node.op)
-                if op_type not in operators:
-                    raise ValueError(f"Unsupported operator: {op_type.__name__}")
-                return operators[op_type](left, right)
-            elif isinstance(node, ast.UnaryOp):
-                operand = _eval(node.operand)
-                op_type = type(node.op)
-                if op_type not in operators:
-                    raise ValueError(f"Unsupported unary operator: {op_type.__name__}")
-                return operators[op_type](operand)
-            elif isinstance(node, ast.Expression):
-                return _eval(node.body)
+        compiled = _compile_math_template(expression.strip())
+        if compiled is not None:
+            code, paths = compiled
+            values = {}
+            for i, path in enumerate(paths):
+                value = self.context.lookup(path)
+                if isinstance(value, str) and _NUMBER_RE.match(value):
+                    value = int(value) if _INT_RE.match(value) else float(value)
+                if type(value) not in (int, float) or not 0 <= value < _INF:
+                    break
+                values[f"_v{i}"] = value
             else:
-                raise ValueError(f"Unsupported expression type: {type(node).__name__}")
+                return float(eval(code, _NO_BUILTINS, values))
+        return self._safe_eval_math(interpolated)
 
+    def _safe_eval_math(self, expression: str) -> float:
+        """Safely evaluate a mathematical expression
+
+        The expression is parsed and checked to contain only numbers and
+        arithmetic operators before being compiled, so eval cannot run
+        arbitrary code.
+        """
         # Clean expression - remove any non-math characters
         cleaned = expression.strip()
         if not cleaned:
             raise ValueError("Empty expression")
 
-        # Parse and evaluate
-        try:
-            tree = ast.parse(cleaned, mode='eval')
-            return float(_eval(tree))
-        except SyntaxError as e:
-            raise ValueError(f"Invalid expression syntax: {e}")
+        return _eval_math_text(cleaned)
 
     def execute_position_check(self, node_data: dict) -> dict:
         """Execute Position Check node - supports {{variable}} interpolation"""
@@ -1802,7 +2259,7 @@ class NodeExecutor:
         threshold = self.get_float(node_data, "threshold", 0)
 
         self.log(f"Checking price condition for: {symbol}")
-        result = self.client.get_quotes(symbol=symbol, exchange=exchange)
+        result = self.quotes.get_quotes(symbol, exchange)
 
         ltp = float(result.get("data", {}).get("ltp", 0))
         condition_met = self._evaluate_condition(ltp, operator, threshold)
@@ -1830,7 +2287,7 @@ class NodeExecutor:
 
         # Fetch current quote using SDK
         self.log(f"Price alert: Fetching quote for {symbol} ({exchange})")
-        result = self.client.get_quotes(symbol=symbol, exchange=exchange)
+        result = self.quotes.get_quotes(symbol, exchange)
 
         if result.get("status") != "success":
             self.log(f"Price alert: Failed to fetch quote - {result}", "error")
@@ -1938,24 +2395,22 @@ class NodeExecutor:
         start_time_str = node_data.get("startTime", "09:15")
         end_time_str = node_data.get("endTime", "15:30")
 
-        now = datetime.now().time()
+        now = datetime.now()
 
         # Use safe time parsing
-        start_h, start_m, start_s = parse_time_string(start_time_str, 9, 15)
-        end_h, end_m, end_s = parse_time_string(end_time_str, 15, 30)
-
-        start_time = time(start_h, start_m, start_s)
-        end_time = time(end_h, end_m, end_s)
+        start_seconds = parse_seconds_of_day(start_time_str, 9, 15)
+        end_seconds = parse_seconds_of_day(end_time_str, 15, 30)
 
-        condition_met = start_time <= now <= end_time
+        condition_met = start_seconds <= _seconds_of_day(now) <= end_seconds
 
+        current = now.strftime("%H:%M:%S")
         self.log(
-            f"Time window check: {start_time_str}-{end_time_str}, current={now.strftime('%H:%M')}, in_window={condition_met}"
+            f"Time window check: {start_time_str}-{end_time_str}, current={current[:5]}, in_window={condition_met}"
         )
         return {
             "status": "success",
             "condition": condition_met,
-            "current_time": now.strftime("%H:%M:%S"),
+            "current_time": current,
         }
 
     def execute_time_condition(self, node_data: dict) -> dict:
@@ -1968,22 +2423,17 @@ class NodeExecutor:
         operator = node_data.get("operator", ">=")
         condition_type = node_data.get("conditionType", "entry")
 
-        now = datetime.now().time()
-
-        # Use safe time parsing
-        target_hour, target_minute, target_second = parse_time_string(target_time_str, 9, 30)
-        target_time = time(target_hour, target_minute, target_second)
+        now = datetime.now()
 
-        # Convert times to comparable values (seconds since midnight)
-        now_seconds = now.hour * 3600 + now.minute * 60 + now.second
-        target_seconds = target_time.hour * 3600 + target_time.minute * 60 + target_time.second
+        # Compare as seconds since midnight (parsed target is cached)
+        now_seconds = _seconds_of_day(now)
+        target_seconds = parse_seconds_of_day(target_time_str, 9, 30)
 
         # Evaluate condition based on operator
         condition_met = False
         if operator == "==":
             # Check if current time matches (within same minute)
-            condition_met = (now.hour == target_time.hour and
-                           now.minute == target_time.minute)
+            condition_met = now_seconds // 60 == target_seconds // 60
         elif operator == ">=":
             condition_met = now_seconds >= target_seconds
         elif operator == "<=":
@@ -1993,14 +2443,15 @@ class NodeExecutor:
         elif operator == "<":
             condition_met = now_seconds < target_seconds
 
+        current = now.strftime("%H:%M:%S")
         self.log(
-            f"Time condition ({condition_type}): current={now.strftime('%H:%M:%S')} {operator} target={target_time_str} = {condition_met}"
+            f"Time condition ({condition_type}): current={current} {operator} target={target_time_str} = {condition_met}"
         )
         return {
             "status": "success",
             "condition": condition_met,
             "condition_type": condition_type,
-            "current_time": now.strftime("%H:%M:%S"),
+            "current_time": current,
             "target_time": target_time_str,
             "operator": operator,
         }
@@ -2009,15 +2460,8 @@ class NodeExecutor:
         self, value: float, operator: str, threshold: float
     ) -> bool:
         """Evaluate a condition"""
-        operators = {
-            "gt": value > threshold,
-            "gte": value >= threshold,
-            "lt": value < threshold,
-            "lte": value <= threshold,
-            "eq": value == threshold,
-            "neq": value != threshold,
-        }
-        return operators.get(operator, False)
+        compare = self._OPS.get(operator)
+        return compare(value, threshold) if compare else False
 
     def execute_and_gate(self, node_data: dict, input_results: List[bool]) -> dict:
         """Execute AND Gate - returns True if ALL inputs are True"""
@@ -2066,6 +2510,76 @@ class NodeExecutor:
             "gate_type": "NOT",
         }
 
+    # Node type -> handler taking (executor, node_data). Logic gates are
+    # dispatched separately because they also need their input results.
+    DISPATCH: Dict[str, Callable[["NodeExecutor", dict], Optional[dict]]] = {
+        # Orders
+        "placeOrder": partial(_execute_generic, node_type="placeOrder"),
+        "smartOrder": partial(_execute_generic, node_type="smartOrder"),
+        "optionsOrder": execute_options_order,
+        "optionsMultiOrder": execute_options_multi_order,
+        "basketOrder": execute_basket_order,
+        "splitOrder": partial(_execute_generic, node_type="splitOrder"),
+        "modifyOrder": execute_modify_order,
+        "cancelOrder": execute_cancel_order,
+        "cancelAllOrders": execute_cancel_all_orders,
+        "closePositions": execute_close_positions,
+        # Market data
+        "getQuote": execute_get_quote,
+        "multiQuotes": execute_multi_quotes,
+        "getDepth": partial(_execute_generic, node_type="getDepth"),
+        "getOrderStatus": execute_get_order_status,
+        "openPosition": partial(_execute_generic, node_type="openPosition"),
+        "history": execute_history,
+        "expiry": partial(_execute_generic, node_type="expiry"),
+        "symbol": partial(_execute_generic, node_type="symbol"),
+        "optionSymbol": partial(_execute_generic, node_type="optionSymbol"),
+        "orderBook": execute_order_book,
+        "tradeBook": execute_trade_book,
+        "positionBook": execute_position_book,
+        "syntheticFuture": partial(_execute_generic, node_type="syntheticFuture"),
+        "optionChain": partial(_execute_generic, node_type="optionChain"),
+        "holidays": execute_holidays,
+        "timings": execute_timings,
+        # WebSocket Streaming
+        "subscribeLtp": execute_subscribe_ltp,
+        "subscribeQuote": execute_subscribe_quote,
+        "subscribeDepth": execute_subscribe_depth,
+        "unsubscribe": execute_unsubscribe,
+        # Risk Management
+        "holdings": execute_holdings,
+        "funds": execute_funds,
+        "margin": execute_margin,
+        # Utilities
+        "telegramAlert": execute_telegram_alert,
+        "httpRequest": execute_http_request,
+        "delay": execute_delay,
+        "waitUntil": execute_wait_until,
+        "log": execute_log,
+        "variable": execute_variable,
+        "mathExpression": execute_math_expression,
+        # Conditions
+        "positionCheck": execute_position_check,
+        "fundCheck": execute_fund_check,
+        "priceCondition": execute_price_condition,
+        "timeWindow": execute_time_window,
+        "timeCondition": execute_time_condition,
+        # Price alert trigger - uses quotes API to check price condition
+        "priceAlert": execute_price_alert,
+        # Group is just a container, pass through
+        "group": lambda executor, node_data: None,
+    }
+
+    # Handlers that never block on I/O and are cheaper to run on the event loop
+    # than in a worker thread
+    INLINE_TYPES = {"log", "variable", "mathExpression", "timeWindow", "timeCondition", "group"}
+
+    GATES: Dict[str, Callable[["NodeExecutor", dict, List[bool]], dict]] = {
+        "andGate": execute_and_gate,
+        "orGate": execute_or_gate,
+        "notGate": execute_not_gate,
+    }
+
 
 async def execute_workflow(workflow_id: int, webhook_data: Optional[Dict[str, Any]] = None) -> dict:
     """Execute a workflow with concurrent execution protection
@@ -2088,8 +2602,22 @@ async def execute_workflow(workflow_id: int, webhook_data: Optional[Dict[str, An
 
     async with lock:
         async with async_session_maker() as db:
-            result = await db.execute(select(Workflow).where(Workflow.id == workflow_id))
-            workflow = result.scalar_one_or_none()
+            # Only the columns needed to run; the row is read-only here
+            client = _cached_client
+            generation = _client_generation
+            graph_generation = _graph_generation
+            query = select(
+                Workflow.id, Workflow.name, Workflow.nodes, Workflow.edges, Workflow.updated_at
+            )
+            if client is None:
+                # Cold client cache: read the settings in the same round trip
+                query = (
+                    query.add_columns(AppSettings.openalgo_api_key, AppSettings.openalgo_host)
+                    .outerjoin(AppSettings, true())
+                    .limit(1)
+                )
+            result = await db.execute(query.where(Workflow.id == workflow_id))
+            workflow = result.one_or_none()
 
             if not workflow:
                 return {"status": "error", "message": "Workflow not found"}
@@ -2097,12 +2625,13 @@ async def execute_workflow(workflow_id: int, webhook_data: Optional[Dict[str, An
             execution = WorkflowExecution(
                 workflow_id=workflow_id,
                 status="running",
-                started_at=datetime.utcnow(),
+                started_at=_utcnow(),
                 logs=[],
             )
             db.add(execution)
+            # The session doesn't expire on commit and the insert assigns the
+            # id, so the row needn't be read back
             await db.commit()
-            await db.refresh(execution)
 
             logs = []
             context = WorkflowContext()
@@ -2110,7 +2639,7 @@ async def execute_workflow(workflow_id: int, webhook_data: Optional[Dict[str, An
             # Inject webhook data into context if provided
             if webhook_data:
                 context.set_variable("webhook", webhook_data)
-                logger.info(f"Webhook data injected: {webhook_data}")
+                logger.info("Webhook data injected: %s", webhook_data)
 
             # Broadcast execution started
             try:
@@ -2119,48 +2648,37 @@ async def execute_workflow(workflow_id: int, webhook_data: Optional[Dict[str, An
                 logger.warning(f"Failed to broadcast execution start: {e}")
 
             try:
-                client = await get_openalgo_client()
+                if client is None:
+                    client = _client_from_settings(
+                        workflow.openalgo_api_key, workflow.openalgo_host, generation
+                    )
                 if not client:
                     raise Exception("OpenAlgo not configured")
 
                 executor = NodeExecutor(client, context, logs)
                 executor.log(f"Starting workflow: {workflow.name}")
 
-                nodes = workflow.nodes or []
-                edges = workflow.edges or []
+                # Reuse the graph maps from the last run unless the workflow changed
+                start_node, nodes_by_id, edge_map, incoming_edge_map = _get_graph(
+                    workflow, graph_generation
+                )
 
-                # Find trigger node (start, webhookTrigger, or priceAlert)
-                trigger_types = ["start", "webhookTrigger", "priceAlert"]
-                start_node = next((n for n in nodes if n.get("type") in trigger_types), None)
                 if not start_node:
                     raise Exception("No trigger node found (start, webhookTrigger, or priceAlert)")
 
-                # Build edge map for traversal (source -> outgoing edges)
-                edge_map: Dict[str, List[dict]] = {}
-                # Build reverse edge map (target -> incoming edges) for logic gates
-                incoming_edge_map: Dict[str, List[dict]] = {}
-                for edge in edges:
-                    source = edge["source"]
-                    target = edge["target"]
-                    if source not in edge_map:
-                        edge_map[source] = []
-                    edge_map[source].append(edge)
-                    if target not in incoming_edge_map:
-                        incoming_edge_map[target] = []
-                    incoming_edge_map[target].append(edge)
-
                 # Track visited nodes and depth to prevent infinite loops
                 visited_count: Dict[str, int] = {}  # Track how many times each node is visited
 
                 # Execute nodes starting from start node
                 await execute_node_chain(
-                    start_node["id"], nodes, edge_map, incoming_edge_map, executor, context,
+                    start_node["id"], nodes_by_id, edge_map, incoming_edge_map, executor, context,
                     visited_count=visited_count, depth=0,
                     workflow_id=workflow_id  # Pass workflow_id for broadcasting
                 )
 
+                logs = _format_log_times(logs)
                 execution.status = "completed"
-                execution.completed_at = datetime.utcnow()
+                execution.completed_at = _utcnow()
                 execution.logs = logs
                 await db.commit()
 
@@ -2181,14 +2699,15 @@ async def execute_workflow(workflow_id: int, webhook_data: Optional[Dict[str, An
                 logger.error(f"Workflow execution failed: {e}")
                 logs.append(
                     {
-                        "time": datetime.utcnow().isoformat(),
+                        "time": time_module.time_ns(),
                         "message": f"Error: {str(e)}",
                         "level": "error",
                     }
                 )
+                logs = _format_log_times(logs)
 
                 execution.status = "failed"
-                execution.completed_at = datetime.utcnow()
+                execution.completed_at = _utcnow()
                 execution.error = str(e)
                 execution.logs = logs
                 await db.commit()
@@ -2202,10 +2721,26 @@ async def execute_workflow(workflow_id: int, webhook_data: Optional[Dict[str, An
                 return {"status": "error", "message": str(e), "execution_id": execution.id, "logs": logs}
 
 
+async def _gather_branches(coros):
+    """Run branches concurrently; if one fails, cancel the rest and re-raise
+
+    Without the cancel, sibling branches would keep placing orders after the
+    run has already been marked failed.
+    """
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 async def execute_node_chain(
     node_id: str,
-    nodes: list,
-    edge_map: Dict[str, List[dict]],
+    nodes_by_id: Dict[str, dict],
+    edge_map: Dict[str, Dict[str, List[dict]]],
     incoming_edge_map: Dict[str, List[dict]],
     executor: NodeExecutor,
     context: WorkflowContext,
@@ -2215,15 +2750,28 @@ async def execute_node_chain(
 ):
     """Execute a chain of nodes starting from the given node
 
+    Linear runs of nodes are walked iteratively instead of recursing per
+    edge, so long pipelines don't build up coroutine frames. When a node fans
+    out to several targets, each branch is walked concurrently with
+    asyncio.gather so a slow broker call in one branch doesn't hold up its
+    siblings. Branches share the context, logs and visited_count; appends and
+    single-key dict writes are atomic under the GIL, so no extra locking is
+    needed for them. Logic gates, and nodes where several branches rejoin,
+    are held until the branches that can still reach them have finished and
+    then run once, so their inputs don't depend on which branch happened to
+    finish first.
+
     Args:
         node_id: The ID of the node to execute
-        nodes: List of all nodes in the workflow
-        edge_map: Map of source node ID to list of outgoing edges
+        nodes_by_id: Map of node ID to node for all nodes in the workflow
+        edge_map: Map of source node ID to outgoing edges, partitioned by
+            sourceHandle into "yes", "no" and "default", plus "all" in edge order
         incoming_edge_map: Map of target node ID to list of incoming edges (for logic gates)
         executor: The node executor instance
         context: The workflow context for variable storage
-        visited_count: Dictionary tracking how many times each node has been visited
-        depth: Current recursion depth
+        visited_count: Dictionary tracking how many times each node has been visited.
+            A visited node is not executed again unless its data sets allowReentry.
+        depth: Current depth of the starting node
         workflow_id: Optional workflow ID for WebSocket broadcasting
 
     Raises:
@@ -2233,229 +2781,257 @@ async def execute_node_chain(
     if visited_count is None:
         visited_count = {}
 
-    # Check depth limit to prevent stack overflow
-    if depth > MAX_NODE_DEPTH:
-        raise Exception(
-            f"Maximum node depth ({MAX_NODE_DEPTH}) exceeded. "
-            "This may indicate a circular connection in your workflow."
-        )
-
-    # Check total visits limit
+    # Nodes with incoming edges from more than one node, where branches rejoin
+    joins = {
+        target for target, edges in incoming_edge_map.items()
+        if len({edge.get("source") for edge in edges}) > 1
+    }
+    # Logic gates and joins reached by a branch (node ID -> depth), held until
+    # the branches that can still reach them have finished, so they see every
+    # input produced alongside them
+    held: Dict[str, int] = {}
+    # Nodes whose SDK calls have already been made ahead of time
+    prefetched: Set[str] = set()
+    # Running sum of visited_count, so the visit limit check is O(1)
     total_visits = sum(visited_count.values())
-    if total_visits >= MAX_NODE_VISITS:
-        raise Exception(
-            f"Maximum node visits ({MAX_NODE_VISITS}) exceeded. "
-            "This may indicate an infinite loop in your workflow."
-        )
 
-    # Track this node visit
-    visited_count[node_id] = visited_count.get(node_id, 0) + 1
+    def lookahead(node: dict) -> List[dict]:
+        """The run of prefetchable nodes starting at node along single edges"""
+        run = [node]
+        while len(run) < MAX_PREFETCH_RUN:
+            branches = edge_map.get(run[-1]["id"])
+            if not branches or len(branches["all"]) != 1:
+                break
+            target_id = branches["all"][0].get("target")
+            target = nodes_by_id.get(target_id)
+            if (
+                target is None
+                or target_id in visited_count
+                or target_id in joins
+                or any(n["id"] == target_id for n in run)
+                or not NodeExecutor.can_prefetch(target)
+            ):
+                break
+            run.append(target)
+        return run
+
+    def reachable(start_id: str) -> Set[str]:
+        """Nodes a branch continuing from start_id could still run into"""
+        seen: Set[str] = set()
+        stack = [start_id]
+        while stack:
+            branches = edge_map.get(stack.pop())
+            if not branches:
+                continue
+            for edge in branches["all"]:
+                target_id = edge.get("target")
+                if not target_id or target_id in seen:
+                    continue
+                seen.add(target_id)
+                target = nodes_by_id.get(target_id)
+                # Branches stop at nodes that already ran and won't re-run
+                if target is not None and (
+                    target_id not in visited_count
+                    or target.get("data", {}).get("allowReentry")
+                ):
+                    stack.append(target_id)
+        return seen
+
+    def releasable() -> List[str]:
+        """Held nodes that no other held node can still reach"""
+        if len(held) == 1:
+            return list(held)
+        reach = {node_id: reachable(node_id) for node_id in held}
+        ready = [
+            node_id for node_id in held
+            if not any(node_id in reach[other] for other in held if other != node_id)
+        ]
+        # Held nodes that all reach each other (a cycle) are released together
+        return ready or list(held)
+
+    async def walk(node_id: str, depth: int, release: bool = False):
+        while node_id is not None:
+            node_id, depth = await step(node_id, depth, release)
+            release = False
+
+    async def step(node_id: str, depth: int, release: bool = False) -> Tuple[Optional[str], int]:
+        """Execute one node and return the next node on this branch, if any"""
+        nonlocal total_visits
+        # Check depth limit to catch circular connections
+        if depth > MAX_NODE_DEPTH:
+            raise Exception(
+                f"Maximum node depth ({MAX_NODE_DEPTH}) exceeded. "
+                "This may indicate a circular connection in your workflow."
+            )
 
-    # Warn if a node is visited too many times (possible loop)
-    if visited_count[node_id] > 10:
-        executor.log(
-            f"Warning: Node {node_id} has been visited {visited_count[node_id]} times. "
-            "Check for unintended loops.",
-            "warning"
-        )
+        node = nodes_by_id.get(node_id)
+        if not node:
+            return None, depth
 
-    node = next((n for n in nodes if n["id"] == node_id), None)
-    if not node:
-        return
-
-    node_type = node.get("type")
-    node_data = node.get("data", {})
-    result = None
-
-    # Execute the node based on its type
-    if node_type == "start":
-        executor.log("Workflow started")
-    elif node_type == "placeOrder":
-        result = executor.execute_place_order(node_data)
-    elif node_type == "smartOrder":
-        result = executor.execute_smart_order(node_data)
-    elif node_type == "optionsOrder":
-        result = executor.execute_options_order(node_data)
-    elif node_type == "optionsMultiOrder":
-        result = executor.execute_options_multi_order(node_data)
-    elif node_type == "basketOrder":
-        result = executor.execute_basket_order(node_data)
-    elif node_type == "splitOrder":
-        result = executor.execute_split_order(node_data)
-    elif node_type == "modifyOrder":
-        result = executor.execute_modify_order(node_data)
-    elif node_type == "cancelOrder":
-        result = executor.execute_cancel_order(node_data)
-    elif node_type == "cancelAllOrders":
-        result = executor.execute_cancel_all_orders(node_data)
-    elif node_type == "closePositions":
-        result = executor.execute_close_positions(node_data)
-    elif node_type == "getQuote":
-        result = executor.execute_get_quote(node_data)
-    elif node_type == "multiQuotes":
-        result = executor.execute_multi_quotes(node_data)
-    elif node_type == "getDepth":
-        result = executor.execute_get_depth(node_data)
-    elif node_type == "getOrderStatus":
-        result = executor.execute_get_order_status(node_data)
-    elif node_type == "openPosition":
-        result = executor.execute_open_position(node_data)
-    elif node_type == "history":
-        result = executor.execute_history(node_data)
-    elif node_type == "expiry":
-        result = executor.execute_expiry(node_data)
-    elif node_type == "symbol":
-        result = executor.execute_symbol(node_data)
-    elif node_type == "optionSymbol":
-        result = executor.execute_option_symbol(node_data)
-    elif node_type == "orderBook":
-        result = executor.execute_order_book(node_data)
-    elif node_type == "tradeBook":
-        result = executor.execute_trade_book(node_data)
-    elif node_type == "positionBook":
-        result = executor.execute_position_book(node_data)
-    elif node_type == "syntheticFuture":
-        result = executor.execute_synthetic_future(node_data)
-    elif node_type == "optionChain":
-        result = executor.execute_option_chain(node_data)
-    elif node_type == "holidays":
-        result = executor.execute_holidays(node_data)
-    elif node_type == "timings":
-        result = executor.execute_timings(node_data)
-    # WebSocket Streaming
-    elif node_type == "subscribeLtp":
-        result = executor.execute_subscribe_ltp(node_data)
-    elif node_type == "subscribeQuote":
-        result = executor.execute_subscribe_quote(node_data)
-    elif node_type == "subscribeDepth":
-        result = executor.execute_subscribe_depth(node_data)
-    elif node_type == "unsubscribe":
-        result = executor.execute_unsubscribe(node_data)
-    # Risk Management
-    elif node_type == "holdings":
-        result = executor.execute_holdings(node_data)
-    elif node_type == "funds":
-        result = executor.execute_funds(node_data)
-    elif node_type == "margin":
-        result = executor.execute_margin(node_data)
-    elif node_type == "telegramAlert":
-        result = executor.execute_telegram_alert(node_data)
-    elif node_type == "httpRequest":
-        result = executor.execute_http_request(node_data)
-    elif node_type == "delay":
-        result = executor.execute_delay(node_data)
-    elif node_type == "waitUntil":
-        result = executor.execute_wait_until(node_data)
-    elif node_type == "log":
-        result = executor.execute_log(node_data)
-    elif node_type == "variable":
-        result = executor.execute_variable(node_data)
-    elif node_type == "mathExpression":
-        result = executor.execute_math_expression(node_data)
-    elif node_type == "positionCheck":
-        result = executor.execute_position_check(node_data)
-    elif node_type == "fundCheck":
-        result = executor.execute_fund_check(node_data)
-    elif node_type == "priceCondition":
-        result = executor.execute_price_condition(node_data)
-    elif node_type == "timeWindow":
-        result = executor.execute_time_window(node_data)
-    elif node_type == "timeCondition":
-        result = executor.execute_time_condition(node_data)
-    elif node_type == "priceAlert":
-        # Price alert trigger - uses quotes API to check price condition
-        result = executor.execute_price_alert(node_data)
-    elif node_type == "group":
-        # Group is just a container, pass through
-        pass
-    elif node_type == "andGate":
-        # AND Gate - collect input condition results
-        incoming_edges = incoming_edge_map.get(node_id, [])
-        input_results = []
-        for edge in incoming_edges:
-            source_id = edge.get("source")
-            source_result = context.get_condition_result(source_id)
-            if source_result is not None:
-                input_results.append(source_result)
-        result = executor.execute_and_gate(node_data, input_results)
-    elif node_type == "orGate":
-        # OR Gate - collect input condition results
-        incoming_edges = incoming_edge_map.get(node_id, [])
-        input_results = []
-        for edge in incoming_edges:
-            source_id = edge.get("source")
-            source_result = context.get_condition_result(source_id)
-            if source_result is not None:
-                input_results.append(source_result)
-        result = executor.execute_or_gate(node_data, input_results)
-    elif node_type == "notGate":
-        # NOT Gate - invert input condition
-        incoming_edges = incoming_edge_map.get(node_id, [])
-        input_results = []
-        for edge in incoming_edges:
-            source_id = edge.get("source")
-            source_result = context.get_condition_result(source_id)
-            if source_result is not None:
-                input_results.append(source_result)
-        result = executor.execute_not_gate(node_data, input_results)
-    else:
-        executor.log(f"Unknown node type: {node_type}", "warning")
+        node_type = node.get("type")
+        if not release and (node_type in NodeExecutor.GATES or node_id in joins):
+            held.setdefault(node_id, depth)
+            return None, depth
 
-    # Broadcast node execution update via WebSocket
-    if workflow_id and node_type != "start":
-        try:
-            node_label = node_data.get("label") or node_type
-            status = "info"
-            if result:
-                status = "success" if result.get("status") == "success" else "error"
-            await broadcast_execution_update(
-                workflow_id,
-                "node_executed",
-                f"Executed: {node_label}"
+        node_data = node.get("data", {})
+
+        # A node reached again (e.g. where two branches reconverge, or around
+        # a cycle) runs only once unless it explicitly allows re-entry
+        if node_id in visited_count and not node_data.get("allowReentry"):
+            logger.debug("Skipping node %s: already executed", node_id)
+            return None, depth
+
+        # Check total visits limit
+        if total_visits >= MAX_NODE_VISITS:
+            raise Exception(
+                f"Maximum node visits ({MAX_NODE_VISITS}) exceeded. "
+                "This may indicate an infinite loop in your workflow."
             )
-        except Exception as e:
-            logger.debug(f"Failed to broadcast node update: {e}")
-
-    # Determine which edges to follow
-    edges_to_follow = edge_map.get(node_id, [])
-
-    # For condition nodes, check which path to take (Yes/No)
-    if result and "condition" in result:
-        condition_met = result.get("condition", False)
-        # Store condition result for logic gates to read
-        context.set_condition_result(node_id, condition_met)
-        filtered_edges = []
-        for edge in edges_to_follow:
-            source_handle = edge.get("sourceHandle", "")
-            if condition_met and source_handle == "yes":
-                filtered_edges.append(edge)
-            elif not condition_met and source_handle == "no":
-                filtered_edges.append(edge)
-            elif source_handle not in ["yes", "no"]:
-                # Default edges always follow
-                filtered_edges.append(edge)
-        edges_to_follow = filtered_edges
-
-    # Execute connected nodes
-    for edge in edges_to_follow:
-        target_id = edge.get("target")
-        if target_id:
-            await execute_node_chain(
-                target_id, nodes, edge_map, incoming_edge_map, executor, context,
-                visited_count=visited_count, depth=depth + 1,
-                workflow_id=workflow_id
+
+        # Track this node visit
+        visited_count[node_id] = visited_count.get(node_id, 0) + 1
+        total_visits += 1
+
+        # Warn if a node is visited too many times (possible loop)
+        if visited_count[node_id] > 10:
+            executor.log(
+                f"Warning: Node {node_id} has been visited {visited_count[node_id]} times. "
+                "Check for unintended loops.",
+                "warning"
             )
 
+        result = None
+
+        # Fetch a straight run of independent lookups ahead, concurrently
+        if node_id not in prefetched and NodeExecutor.can_prefetch(node):
+            run = lookahead(node)
+            if len(run) > 1:
+                prefetched.update(n["id"] for n in run)
+                await executor.prefetch_lookups(run)
+
+        # Execute the node based on its type
+        handler = NodeExecutor.DISPATCH.get(node_type)
+        if handler is not None:
+            if asyncio.iscoroutinefunction(handler):
+                result = await handler(executor, node_data)
+            elif node_type in NodeExecutor.INLINE_TYPES:
+                result = handler(executor, node_data)
+            else:
+                # SDK calls are blocking HTTP; keep them off the event loop so
+                # concurrent branches can overlap their I/O
+                result = await asyncio.get_running_loop().run_in_executor(
+                    _node_pool, partial(handler, executor, node_data)
+                )
+        elif node_type == "start":
+            executor.log("Workflow started")
+        elif node_type in NodeExecutor.GATES:
+            # Logic gate - collect input condition results
+            input_results = []
+            for edge in incoming_edge_map.get(node_id, []):
+                source_result = context.get_condition_result(edge.get("source"))
+                if source_result is not None:
+                    input_results.append(source_result)
+            result = NodeExecutor.GATES[node_type](executor, node_data, input_results)
+        else:
+            executor.log(f"Unknown node type: {node_type}", "warning")
 
-def execute_workflow_sync(workflow_id: int):
-    """Synchronous wrapper for execute_workflow (for APScheduler)"""
-    loop = asyncio.new_event_loop()
+        # Broadcast node execution update via WebSocket
+        if workflow_id and node_type != "start" and ws_manager.has_connections():
+            try:
+                node_label = node_data.get("label") or node_type
+                queue_execution_update(workflow_id, "node_executed", f"Executed: {node_label}")
+            except Exception as e:
+                logger.debug("Failed to broadcast node update: %s", e)
+
+        # Determine which edges to follow
+        branches = edge_map.get(node_id)
+
+        # For condition nodes, take the Yes/No path plus any default edges
+        if result and "condition" in result:
+            condition_met = result.get("condition", False)
+            # Store condition result for logic gates to read
+            context.set_condition_result(node_id, condition_met)
+            if branches:
+                taken = branches["yes"] if condition_met else branches["no"]
+                edges_to_follow = taken + branches["default"] if branches["default"] else taken
+            else:
+                edges_to_follow = []
+        else:
+            edges_to_follow = branches["all"] if branches else []
+
+        # Continue along a single edge, or run fanned-out branches concurrently
+        targets = [edge["target"] for edge in edges_to_follow if edge.get("target")]
+        if len(targets) == 1:
+            return targets[0], depth + 1
+        if targets:
+            quote_nodes = [
+                nodes_by_id[t] for t in dict.fromkeys(targets)
+                if t in nodes_by_id and nodes_by_id[t].get("type") in QuoteBatcher.NODE_TYPES
+            ]
+            # Batching needs at least two quotes; skip the thread hop otherwise
+            if len(quote_nodes) > 1:
+                await asyncio.get_running_loop().run_in_executor(
+                    _node_pool, executor.prefetch_quotes, quote_nodes
+                )
+            await _gather_branches(walk(target, depth + 1) for target in targets)
+        return None, depth
+
+    await walk(node_id, depth)
+
+    # Run held nodes once the branches feeding them have finished; nodes held
+    # by these runs are collected for the following round
+    while held:
+        ready = [(held_id, held.pop(held_id)) for held_id in releasable()]
+        await _gather_branches(
+            walk(held_id, held_depth, release=True) for held_id, held_depth in ready
+        )
+
+
+# Event loops reused by execute_workflow_sync, one per scheduler worker thread
+_thread_local = threading.local()
+_thread_loops: List[asyncio.AbstractEventLoop] = []
+_thread_loops_lock = threading.Lock()
+
+
+def _get_thread_loop() -> asyncio.AbstractEventLoop:
+    """Get or create the event loop owned by the current thread"""
+    loop = getattr(_thread_local, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _thread_local.loop = loop
+        with _thread_loops_lock:
+            _thread_loops.append(loop)
     asyncio.set_event_loop(loop)
-    try:
+    return loop
+
+
+@atexit.register
+def _close_thread_loops():
+    """Close the per-thread event loops on interpreter shutdown"""
+    with _thread_loops_lock:
+        loops = list(_thread_loops)
+        _thread_loops.clear()
+    for loop in loops:
+        if not loop.is_closed() and not loop.is_running():
+            loop.close()
+
+
+def execute_workflow_sync(workflow_id: int):
+    """Synchronous wrapper for execute_workflow (for APScheduler)
+
+    Scheduled jobs run in a worker thread. When the scheduler's event loop is
+    running, the workflow is submitted to it, so no loop is created per run and
+    the database engine is only ever driven from that one loop. Otherwise a
+    loop owned by the calling thread is reused across runs.
+    """
+    app_loop = workflow_scheduler.event_loop
+    if app_loop is not None and app_loop.is_running():
+        future = asyncio.run_coroutine_threadsafe(execute_workflow(workflow_id), app_loop)
+        result = future.result()
+    else:
+        loop = _get_thread_loop()
         result = loop.run_until_complete(execute_workflow(workflow_id))
-        logger.info(f"Scheduled execution result: {result}")
-    finally:
-        loop.close()
+    logger.info("Scheduled execution result: %s", result)
 
 
 async def _activate_price_alert(workflow: Workflow, trigger_node: dict, db: AsyncSession) -> dict:
@@ -2540,7 +3116,11 @@ async def _activate_price_alert(workflow: Workflow, trigger_node: dict, db: Asyn
 
 async def activate_workflow(workflow_id: int, db: AsyncSession) -> dict:
     """Activate a workflow and schedule it"""
-    result = await db.execute(select(Workflow).where(Workflow.id == workflow_id))
+    result = await db.execute(
+        select(Workflow)
+        .options(load_only(Workflow.id, Workflow.nodes, Workflow.is_active, Workflow.schedule_job_id))
+        .where(Workflow.id == workflow_id)
+    )
     workflow = result.scalar_one_or_none()
 
     if not workflow:
@@ -2549,8 +3129,7 @@ async def activate_workflow(workflow_id: int, db: AsyncSession) -> dict:
     nodes = workflow.nodes or []
 
     # Find trigger node (start, webhookTrigger, or priceAlert)
-    trigger_types = ["start", "webhookTrigger", "priceAlert"]
-    start_node = next((n for n in nodes if n.get("type") in trigger_types), None)
+    start_node = next((n for n in nodes if n.get("type") in _TRIGGER_TYPES), None)
 
     if not start_node:
         return {"status": "error", "message": "No trigger node found (start, webhookTrigger, or priceAlert)"}
@@ -2616,7 +3195,11 @@ async def activate_workflow(workflow_id: int, db: AsyncSession) -> dict:
 
 async def deactivate_workflow(workflow_id: int, db: AsyncSession) -> dict:
     """Deactivate a workflow and remove from scheduler/price monitor"""
-    result = await db.execute(select(Workflow).where(Workflow.id == workflow_id))
+    result = await db.execute(
+        select(Workflow)
+        .options(load_only(Workflow.id, Workflow.is_active, Workflow.schedule_job_id))
+        .where(Workflow.id == workflow_id)
+    )
     workflow = result.scalar_one_or_none()
 
     if not workflow:
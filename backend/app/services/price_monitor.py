@@ -9,7 +9,7 @@ from typing import Dict, Any, Optional, Callable, List, Set
 from dataclasses import dataclass, field
 from datetime import datetime
 
-from app.core.openalgo import OpenAlgoClient
+from app.core.openalgo import OpenAlgoClient, ws_instrument
 from app.core.database import async_session_maker
 
 logger = logging.getLogger(__name__)
@@ -166,7 +166,7 @@ class PriceMonitor:
             return
 
         try:
-            instruments = [{"exchange": exchange, "symbol": symbol}]
+            instruments = [ws_instrument(exchange, symbol)]
             self._client.ws_subscribe_ltp(instruments, self._on_price_update)
             logger.info(f"Subscribed to LTP: {symbol}@{exchange}")
         except Exception as e:
@@ -178,8 +178,8 @@ class PriceMonitor:
             return
 
         try:
-            instruments = [{"exchange": exchange, "symbol": symbol}]
-            self._client.ws_unsubscribe_ltp(instruments)
+            instruments = [ws_instrument(exchange, symbol)]
+            self._client.ws_unsubscribe_ltp(instruments, self._on_price_update)
             logger.info(f"Unsubscribed from LTP: {symbol}@{exchange}")
         except Exception as e:
             logger.error(f"Failed to unsubscribe from {symbol}@{exchange}: {e}")
@@ -198,7 +198,7 @@ class PriceMonitor:
         """
         try:
             # Debug: Log raw data received
-            logger.debug(f"Price update received: {data}")
+            logger.debug("Price update received: %s", data)
 
             symbol = data.get("symbol")
             exchange = data.get("exchange")
@@ -211,20 +211,23 @@ class PriceMonitor:
                 logger.warning(f"Incomplete price data: symbol={symbol}, exchange={exchange}, ltp={ltp}")
                 return
 
-            logger.debug(f"LTP Update: {symbol}@{exchange} = {ltp}")
+            logger.debug("LTP Update: %s@%s = %s", symbol, exchange, ltp)
 
             key = self._get_subscription_key(symbol, exchange)
             workflow_ids = self._subscriptions.get(key, set())
 
-            logger.debug(f"Checking {len(workflow_ids)} alerts for {key}")
+            logger.debug("Checking %d alerts for %s", len(workflow_ids), key)
 
             for workflow_id in list(workflow_ids):  # Use list() to avoid modification during iteration
                 alert = self._alerts.get(workflow_id)
                 if alert and not alert.triggered:
-                    logger.debug(f"Checking alert for workflow {workflow_id}: {alert.condition} {alert.target_price}, last_price={alert.last_price}, current={ltp}")
+                    logger.debug(
+                        "Checking alert for workflow %s: %s %s, last_price=%s, current=%s",
+                        workflow_id, alert.condition, alert.target_price, alert.last_price, ltp,
+                    )
                     self._check_and_trigger(alert, float(ltp))
                 elif alert and alert.triggered:
-                    logger.debug(f"Alert for workflow {workflow_id} already triggered")
+                    logger.debug("Alert for workflow %s already triggered", workflow_id)
 
         except Exception as e:
             logger.error(f"Error processing price update: {e}")
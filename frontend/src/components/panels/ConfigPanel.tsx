@@ -210,6 +210,12 @@ const NODE_TITLES: Record<string, string> = {
   margin: 'Margin Calculator',
 }
 
+// Reference-data nodes whose responses the backend caches
+const CACHED_NODE_TYPES = ['symbol', 'holidays', 'timings']
+
+// Nodes without a re-entry setting: triggers start the run, groups only organize
+const NO_REENTRY_NODE_TYPES = ['start', 'priceAlert', 'webhookTrigger', 'group']
+
 export function ConfigPanel() {
   const { nodes, selectedNodeId, updateNodeData, deleteNode, selectNode } = useWorkflowStore()
   const { id: workflowId } = useParams<{ id: string }>()
@@ -3239,6 +3245,38 @@ export function ConfigPanel() {
               </div>
             </>
           )}
+
+          {/* ===== COMMON: REFERENCE DATA CACHE ===== */}
+          {CACHED_NODE_TYPES.includes(nodeType) && (
+            <div className="flex items-center justify-between rounded-lg border border-border p-3">
+              <div>
+                <Label>Skip Cache</Label>
+                <p className="text-xs text-muted-foreground">
+                  Always fetch fresh data instead of a cached response
+                </p>
+              </div>
+              <Switch
+                checked={(nodeData.dontUseCache as boolean) ?? false}
+                onCheckedChange={(v) => handleDataChange('dontUseCache', v)}
+              />
+            </div>
+          )}
+
+          {/* ===== COMMON: RE-ENTRY ===== */}
+          {!NO_REENTRY_NODE_TYPES.includes(nodeType) && (
+            <div className="flex items-center justify-between rounded-lg border border-border p-3">
+              <div>
+                <Label>Allow Re-entry</Label>
+                <p className="text-xs text-muted-foreground">
+                  Run again each time a loop or another branch reaches this node
+                </p>
+              </div>
+              <Switch
+                checked={(nodeData.allowReentry as boolean) ?? false}
+                onCheckedChange={(v) => handleDataChange('allowReentry', v)}
+              />
+            </div>
+          )}
         </div>
       </ScrollArea>
 